@@ -0,0 +1,302 @@
+"""Бенчмарк довгої арифметики (srom.longarith) та полів GF(2^m) (srom.gf2m, srom.onb)
+
+Кожна операція запускається на входах фіксованої форми (однаковий seed для кожного
+розміру), спершу прогрівається, потім вимірюється окремо кожен виклик. У звіті
+медіана, p95 і кількість операцій за секунду; для довгої арифметики поруч наводиться
+вбудований int/pow як базовий рівень, а результати звіряються з ним.
+
+    python benchmarks/bench.py --output bench.json
+    python benchmarks/bench.py --compare old.json --output new.json
+"""
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [256, 512, 1024, 2048, 4096, 8192, 16384]
+POLY_FIELDS = {
+    163: (163, 7, 6, 3, 0),
+    173: (173, 10, 2, 1, 0),
+    233: (233, 74, 0),
+    283: (283, 12, 7, 5, 0),
+    409: (409, 87, 0),
+    571: (571, 10, 5, 2, 0),
+}
+ONB_FIELDS = [173, 233, 281]
+
+
+def load_module(name):
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return importlib.import_module(f"srom.{name}")
+
+
+def measure(func, args, repeat, warmup):
+    """Медіана, p95 та операцій за секунду для окремих викликів func(*args)"""
+    for _ in range(warmup):
+        func(*args)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    median = statistics.median(samples)
+    p95 = samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)]
+    return {
+        "median": median,
+        "p95": p95,
+        "ops_per_sec": 1 / median if median else float("inf"),
+        "samples": len(samples),
+    }
+
+
+def bench_longarith(sizes, repeat, warmup, modpow_max_bits):
+    L = load_module("longarith")
+    to_int = L._LimbsToInt
+    results = []
+    for bits in sizes:
+        rng = random.Random(bits)
+        n_int = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        a_int = rng.getrandbits(bits) % n_int
+        b_int = rng.getrandbits(bits) % n_int
+        wide_int = rng.getrandbits(2 * bits)
+        a, b, n, wide = (L.to_base_2_32(x) for x in (a_int, b_int, n_int, wide_int))
+        ctx = L.GetModContext(n)
+
+        cases = [
+            ("mul", L.LongMul, (a, b), a_int * b_int, lambda x, y: x * y, (a_int, b_int)),
+            ("square", L.LongSquare, (a,), a_int * a_int, lambda x: x * x, (a_int,)),
+            ("divmod", L.LongDivMod, (wide, n), None, divmod, (wide_int, n_int)),
+            ("add_mod", L.LongAddMod, (a, b, ctx), (a_int + b_int) % n_int,
+             lambda x, y, m: (x + y) % m, (a_int, b_int, n_int)),
+            ("mul_mod", L.LongMulMod, (a, b, ctx), a_int * b_int % n_int,
+             lambda x, y, m: x * y % m, (a_int, b_int, n_int)),
+            ("gcd", L.LongGCD, (a, b), math.gcd(a_int, b_int), math.gcd, (a_int, b_int)),
+        ]
+        if math.gcd(a_int, n_int) == 1:
+            cases.append(("mod_inverse", L.LongModInverse, (a, n), pow(a_int, -1, n_int),
+                          lambda x, m: pow(x, -1, m), (a_int, n_int)))
+        if bits <= modpow_max_bits:
+            for method in ("barrett", "montgomery"):
+                cases.append((f"modpow_{method}", L.LongModPower, (a, b_int, ctx, method),
+                              pow(a_int, b_int, n_int), pow, (a_int, b_int, n_int)))
+
+        for op, func, args, expected, baseline, baseline_args in cases:
+            result = func(*args)
+            if op == "divmod":
+                ok = (to_int(result[0]), to_int(result[1])) == divmod(wide_int, n_int)
+            else:
+                ok = to_int(result) == expected
+            slow = op.startswith("modpow")
+            entry = {
+                "suite": "longarith",
+                "op": op,
+                "bits": bits,
+                "correct": ok,
+                "stats": measure(func, args, max(1, repeat // 10) if slow else repeat, min(warmup, 1) if slow else warmup),
+                "baseline": measure(baseline, baseline_args, repeat, warmup),
+            }
+            entry["slowdown_vs_int"] = entry["stats"]["median"] / entry["baseline"]["median"]
+            results.append(entry)
+            report(entry)
+    return results
+
+
+def clmul_mod(a, b, poly):
+    """Еталонне множення многочленів над GF(2) з редукцією для перевірки результатів"""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        b >>= 1
+    degree = poly.bit_length() - 1
+    while result.bit_length() > degree:
+        result ^= poly << (result.bit_length() - 1 - degree)
+    return result
+
+
+def reference_power(a, exp, poly):
+    result = 1
+    for bit in bin(exp)[2:]:
+        result = clmul_mod(result, result, poly)
+        if bit == '1':
+            result = clmul_mod(result, a, poly)
+    return result
+
+
+def reference_trace(a, m, poly):
+    result, current = a, a
+    for _ in range(1, m):
+        current = clmul_mod(current, current, poly)
+        result ^= current
+    return result
+
+
+def bench_gf2m(fields, repeat, warmup):
+    G = load_module("gf2m")
+    results = []
+    for m in fields:
+        poly = sum(1 << e for e in POLY_FIELDS[m])
+        field = G.GaloisField(m, poly)
+        rng = random.Random(m)
+        a, b = rng.getrandbits(m) | 1, rng.getrandbits(m) | 1
+        checks = {
+            "add": (field.add, (a, b), a ^ b),
+            "multiply": (field.multiply, (a, b), clmul_mod(a, b, poly)),
+            "square": (field.square, (a,), clmul_mod(a, a, poly)),
+            "power": (field.power, (a, 0b1001), reference_power(a, 0b1001, poly)),
+            "inverse": (field.inverse, (a,), None),
+            "trace": (field.trace, (a,), reference_trace(a, m, poly)),
+        }
+        for op, (func, args, expected) in checks.items():
+            result = func(*args)
+            correct = None if expected is None else result == expected
+            if op == "inverse":
+                correct = field.multiply(a, result) == 1
+            slow = op in ("inverse", "trace")
+            entry = {
+                "suite": "gf2m",
+                "op": op,
+                "bits": m,
+                "correct": correct,
+                "stats": measure(func, args, max(1, repeat // 10) if slow else repeat, min(warmup, 1) if slow else warmup),
+            }
+            results.append(entry)
+            report(entry)
+    return results
+
+
+def onb_matrix_mul(a, b, m, matrix):
+    """Еталонне множення в ONB: c_i = a(i)^T * Lambda * b(i), a(i) — вектор a, зсунутий вліво на i"""
+    a_bits = [(a >> (m - 1 - k)) & 1 for k in range(m)]
+    b_bits = [(b >> (m - 1 - k)) & 1 for k in range(m)]
+    result = 0
+    for i in range(m):
+        bit = 0
+        for k in range(m):
+            if a_bits[(k + i) % m]:
+                for j in range(m):
+                    bit ^= matrix[k][j] & b_bits[(j + i) % m]
+        result |= bit << (m - 1 - i)
+    return result
+
+
+def bench_onb(fields, repeat, warmup):
+    O = load_module("onb")
+    results = []
+    for m in fields:
+        field = O.GaloisFieldONB(m)
+        if not field.check_ONB()[0]:
+            continue
+        rng = random.Random(m)
+        a, b = rng.getrandbits(m), rng.getrandbits(m)
+        # квадрат у нормальному базисі — циклічний зсув коефіцієнтів, слід — їх сума
+        square_ref = ((a >> 1) | (a << (m - 1))) & ((1 << m) - 1)
+        for op, func, args, expected in (
+            ("add", field.add, (a, b), a ^ b),
+            ("square", field.square, (a,), square_ref),
+            ("trace", field.trace, (a,), bin(a).count("1") & 1),
+            ("mul", field.mul, (a, b), onb_matrix_mul(a, b, m, field.matrix)),
+        ):
+            slow = op == "mul"
+            entry = {
+                "suite": "onb",
+                "op": op,
+                "bits": m,
+                "correct": func(*args) == expected,
+                "stats": measure(func, args, max(1, repeat // 10) if slow else repeat, min(warmup, 1) if slow else warmup),
+            }
+            results.append(entry)
+            report(entry)
+    return results
+
+
+def report(entry):
+    stats = entry["stats"]
+    line = (f"{entry['suite']:>9} {entry['op']:>18} {entry['bits']:>6} bit  "
+            f"median {stats['median'] * 1e6:12.2f} us  p95 {stats['p95'] * 1e6:12.2f} us  "
+            f"{stats['ops_per_sec']:12.1f} op/s")
+    if "baseline" in entry:
+        line += f"  x{entry['slowdown_vs_int']:.1f} vs int"
+    if entry["correct"] is False:
+        line += "  MISMATCH"
+    print(line, flush=True)
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old_path, results):
+    """Порівняння медіан з попереднім JSON-звітом"""
+    with open(old_path) as f:
+        old = {(r["suite"], r["op"], r["bits"]): r for r in json.load(f)["results"]}
+    print(f"\nПорівняння з {old_path}:")
+    for entry in results:
+        key = (entry["suite"], entry["op"], entry["bits"])
+        if key in old:
+            ratio = entry["stats"]["median"] / old[key]["stats"]["median"]
+            print(f"{key[0]:>9} {key[1]:>18} {key[2]:>6} bit  x{ratio:.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=["longarith", "gf2m", "onb", "all"], default="all")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="розміри операндів довгої арифметики в бітах")
+    parser.add_argument("--fields", type=int, nargs="+", default=sorted(POLY_FIELDS),
+                        choices=sorted(POLY_FIELDS),
+                        help="степені m для поліноміального базису")
+    parser.add_argument("--onb-fields", type=int, nargs="+", default=ONB_FIELDS)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--modpow-max-bits", type=int, default=2048,
+                        help="найбільший розмір, для якого вимірюється піднесення до степеня")
+    parser.add_argument("--output", help="шлях до JSON-звіту")
+    parser.add_argument("--compare", help="попередній JSON-звіт для порівняння")
+    args = parser.parse_args(argv)
+
+    results = []
+    if args.suite in ("longarith", "all"):
+        results += bench_longarith(args.sizes, args.repeat, args.warmup, args.modpow_max_bits)
+    if args.suite in ("gf2m", "all"):
+        results += bench_gf2m(args.fields, args.repeat, args.warmup)
+    if args.suite in ("onb", "all"):
+        results += bench_onb(args.onb_fields, args.repeat, args.warmup)
+
+    report_data = {
+        "revision": git_revision(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report_data, f, indent=2)
+    if args.compare:
+        compare(args.compare, results)
+    if any(entry["correct"] is False for entry in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""Довга арифметика та арифметика полів GF(2^m)
+
+Підмодулі (longarith, gf2m, onb, fields, basis, ec2m) і основні класи завантажуються
+ліниво, при першому зверненні, тому ``import srom`` не виконує обчислень і не
+імпортує NumPy.
+"""
+import importlib
+
+_SUBMODULES = ("longarith", "gf2m", "onb", "fields", "basis", "ec2m", "cli")
+_EXPORTS = {
+    "BasisConverter": "basis",
+    "BinaryCurve": "ec2m",
+    "GaloisField": "gf2m",
+    "GaloisFieldONB": "onb",
+    "GetModContext": "longarith",
+    "LimbVector": "longarith",
+    "ModContext": "longarith",
+    "MontgomeryContext": "longarith",
+    "get_field": "fields",
+}
+
+__all__ = [*_SUBMODULES, *_EXPORTS]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
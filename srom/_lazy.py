@@ -0,0 +1,14 @@
+import importlib
+
+
+class LazyModule:
+    """Модуль, що імпортується лише при першому зверненні до його атрибутів"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
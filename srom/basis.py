@@ -0,0 +1,139 @@
+"""Перехід між поліноміальним базисом (GaloisField) та ONB типу II (GaloisFieldONB)
+
+Нормальний елемент beta = gamma + gamma^(-1), де gamma — корінь степеня p = 2m + 1 з
+одиниці у квадратичному розширенні GF(2^m)[z]/(z^2 + z + delta). Стовпці матриці
+переходу — спряжені beta^(2^i) у поліноміальному базисі, обернена матриця
+знаходиться виключенням Гаусса на упакованих числах, а обидві застосовуються
+байтовими таблицями (метод чотирьох росіян): ceil(m/8) XOR на перетворення.
+"""
+from collections import OrderedDict
+
+from .onb import GaloisFieldONB
+
+CONVERTER_CACHE_SIZE = 16
+_converter_cache = OrderedDict()
+
+
+class BasisConverter:
+    def __init__(self, field, onb=None):
+        if onb is None:
+            onb = GaloisFieldONB(field.m)
+        if onb.m != field.m:
+            raise ValueError("Fields must have the same degree")
+        if not onb.check_ONB()[0]:
+            raise ValueError(f"No type II optimal normal basis for m = {field.m}")
+        self.field = field
+        self.onb = onb
+        self.m = field.m
+        self.nbytes = (self.m + 7) // 8
+        self.normal_element = self._normal_element()
+        # біт m-1-i числа ONB — коефіцієнт при beta^(2^i)
+        images = [0] * self.m
+        conjugate = self.normal_element
+        for i in range(self.m):
+            images[self.m - 1 - i] = conjugate
+            conjugate = field.square(conjugate)
+        self.onb_to_poly_images = images
+        self.poly_to_onb_images = self._invert(images)
+        self._to_poly_tables = self._byte_tables(self.onb_to_poly_images)
+        self._to_onb_tables = self._byte_tables(self.poly_to_onb_images)
+
+    def _ext_mul(self, a, b, delta):
+        """Множення у GF(2^m)[z]/(z^2 + z + delta): елементи — пари (u0, u1) = u0 + u1*z"""
+        mul = self.field.multiply
+        a0b0, a1b1 = mul(a[0], b[0]), mul(a[1], b[1])
+        cross = mul(a[0] ^ a[1], b[0] ^ b[1]) ^ a0b0  # a0*b1 + a1*b0 + a1*b1
+        return a0b0 ^ mul(a1b1, delta), cross
+
+    def _ext_power(self, a, exp, delta):
+        result = (1, 0)
+        for bit in bin(exp)[2:]:
+            result = self._ext_mul(result, result, delta)
+            if bit == '1':
+                result = self._ext_mul(result, a, delta)
+        return result
+
+    def _normal_element(self):
+        """beta = gamma + gamma^(-1) у поліноміальному базисі"""
+        field = self.field
+        p = 2 * self.m + 1
+        tau = field.trace_mask
+        delta = tau & -tau  # Tr(delta) = 1, тож z^2 + z + delta незвідний над GF(2^m)
+        cofactor = ((1 << (2 * self.m)) - 1) // p
+        for k in range(1 << self.m):
+            gamma = self._ext_power((k, 1), cofactor, delta)
+            if gamma != (1, 0):
+                break
+        gamma_inv = self._ext_power(gamma, p - 1, delta)
+        beta = (gamma[0] ^ gamma_inv[0], gamma[1] ^ gamma_inv[1])
+        if beta[1] != 0 or beta[0] == 0:
+            raise ValueError("Failed to derive a normal element")
+        return beta[0]
+
+    def _invert(self, images):
+        """Обернена матриця над GF(2) виключенням Гаусса: пари (образ, позначка) як числа"""
+        rows = [(image, 1 << b) for b, image in enumerate(images)]
+        result = [0] * self.m
+        for bit in range(self.m - 1, -1, -1):
+            pivot = next((i for i, (image, _) in enumerate(rows) if (image >> bit) & 1), None)
+            if pivot is None:
+                raise ValueError("Conversion matrix is singular")
+            image, tag = rows.pop(pivot)
+            for i, (other, other_tag) in enumerate(rows):
+                if (other >> bit) & 1:
+                    rows[i] = (other ^ image, other_tag ^ tag)
+            # image має старший біт bit; молодші біти ще будуть виключені
+            result[bit] = (image, tag)
+        # зворотний хід: від молодших півотів до старших
+        for bit in range(self.m):
+            image, tag = result[bit]
+            low = image ^ (1 << bit)
+            while low:
+                j = low.bit_length() - 1
+                tag ^= result[j]
+                low ^= 1 << j
+            result[bit] = tag
+        return result
+
+    def _byte_tables(self, images):
+        """Для кожного байта входу — 256 XOR-комбінацій образів його бітів"""
+        tables = []
+        for j in range(self.nbytes):
+            basis = [images[8 * j + i] if 8 * j + i < self.m else 0 for i in range(8)]
+            row = [0] * 256
+            for v in range(1, 256):
+                low = v & -v
+                row[v] = row[v ^ low] ^ basis[low.bit_length() - 1]
+            tables.append(row)
+        return tables
+
+    def _apply(self, tables, a):
+        result = 0
+        for row, byte in zip(tables, a.to_bytes(self.nbytes, 'little')):
+            if byte:
+                result ^= row[byte]
+        return result
+
+    def to_poly(self, a):
+        """Елемент ONB -> поліноміальний базис"""
+        return self._apply(self._to_poly_tables, a & self.onb.mask)
+
+    def to_onb(self, a):
+        """Елемент поліноміального базису -> ONB"""
+        if a >> self.m:
+            a = self.field.module(a)
+        return self._apply(self._to_onb_tables, a)
+
+
+def get_converter(field, onb=None):
+    """Перетворювач базисів з LRU-кешу за (m, модуль) поля"""
+    key = (field.m, field.irreducible_poly)
+    converter = _converter_cache.get(key)
+    if converter is None:
+        converter = BasisConverter(field, onb)
+        _converter_cache[key] = converter
+        while len(_converter_cache) > CONVERTER_CACHE_SIZE:
+            _converter_cache.popitem(last=False)
+    else:
+        _converter_cache.move_to_end(key)
+    return converter
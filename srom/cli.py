@@ -0,0 +1,317 @@
+"""Демонстрації лабораторних робіт як точки входу командного рядка
+
+    python -m srom longarith | gf2m | onb
+"""
+import sys
+import time
+
+from .gf2m import GaloisField
+from .longarith import (
+    ComputeMU, LongAddMod, LongMulMod, LongMulSquareMod, LongSubMod,
+    blocks_to_number, gcd_and_lcm, to_base_2_32,
+)
+from .onb import GaloisFieldONB
+
+
+def measure_time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    end = time.perf_counter()
+    return end - start
+
+def benchmark_operations(a, b, n, mu, num_trials=10):
+    times = {
+        "Addition": [],
+        "Subtraction": [],
+        "Multiplication": [],
+        "Square": [],
+        #"Power": [],
+        "GCD": [],
+        "LCM": []
+    }
+
+    for _ in range(num_trials):
+        time_add = measure_time(LongAddMod, a, b, n, mu)
+        times["Addition"].append(time_add)
+
+    for _ in range(num_trials):
+        time_sub = measure_time(LongSubMod, a, b, n, mu)
+        times["Subtraction"].append(time_sub)
+
+    for _ in range(num_trials):
+        time_mul = measure_time(LongMulMod, a, b, n, mu)
+        times["Multiplication"].append(time_mul)
+
+    for _ in range(num_trials):
+        time_square = measure_time(LongMulSquareMod, a, n, mu)
+        times["Square"].append(time_square)
+
+    #for _ in range(num_trials):
+    #    time_power = measure_time(LongModPowerBarrett, a, [int(bit) for bit in bin(int('1001', 2))[2:]], n)
+    #    times["Power"].append(time_power)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        gcd, _ = gcd_and_lcm(int(blocks_to_number(a), 16), int(blocks_to_number(b), 16))
+        end = time.perf_counter()
+        times["GCD"].append(end - start)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        _, _ = gcd_and_lcm(int(blocks_to_number(a), 16), int(blocks_to_number(b), 16))
+        end = time.perf_counter()
+        times["LCM"].append(end - start)
+
+    avg_times = {operation: sum(times_list) / len(times_list) for operation, times_list in times.items()}
+
+    return avg_times
+
+
+def longarith_demo():
+    """Демонстрація лабораторних 1-2: довга арифметика за модулем"""
+    print('------------------------Test_2------------------------')
+
+    num1 = 0x64f2f304f9dc8c27eb8fb1ae60a48e908c5a093ea94550ed833ba190aa0ce727be42b
+    num2 = 0x4f89d34fe242dc2290022ae1697c9111311b6cd07e67e6192da1c689a571c981f3747
+    mod = 0x2176e5552a5da631a626eacee24d370a898a05eaea461bdfb5f8d127d1672c4078a95
+
+
+    a = to_base_2_32(num1)
+    b = to_base_2_32(num2)
+    b1 = [int(bit) for bit in bin(num2)[2:]]
+    n = to_base_2_32(mod)
+    mu = ComputeMU(n)
+
+    #print(f'a = {a}')
+    #print(f'b = {b}')
+    #print(f'n = {n}')
+    #print(f'mu = {mu}')
+
+    #resAdd = LongAdd(a, b, w = 32)
+    #resHexAdd = blocks_to_number(resAdd)
+
+    #resSub = LongSub(a, b, w = 32)
+    #resHexSub = blocks_to_number(resSub)
+
+    #resMult = LongMul(a, b)
+    #resHexMul = blocks_to_number(resMult)
+
+    #resDiv = LongDivMod(a, b)
+    #q = LongDivMod(a, b)[0]
+    #r = LongDivMod(a, b)[1]
+
+    gcd, lcm = gcd_and_lcm(num1, num2)
+
+    gcd_blocks = to_base_2_32(gcd)
+    lcm_blocks = to_base_2_32(lcm)
+    gcd_from_blocks = blocks_to_number(gcd_blocks)
+    lcm_from_blocks = blocks_to_number(lcm_blocks)
+
+    #print('A + B:', resHexAdd)
+    #print('A - B:', resHexSub)
+    #print('A х B:', resHexMul)
+    #print('Ціла частка Q від A / B:', blocks_to_number(q))
+    #print('Остача R від A / B:', blocks_to_number(r))
+
+    print(f"НСД: {gcd_from_blocks}")
+    print(f"НСК: {lcm_from_blocks}")
+
+    result_add = LongAddMod(a, b, n, mu)
+    result_add_number = blocks_to_number(result_add)
+    print("Результат додавання за модулем:")
+    print(f"(num1 + num2) mod n: {result_add_number}\n")
+
+    result_sub = LongSubMod(a, b, n, mu)
+    result_sub_number = blocks_to_number(result_sub)
+    print("Результат віднімання за модулем:")
+    print(f"(num1 - num2) mod n: {result_sub_number}\n")
+
+    result_mul = LongMulMod(a, b, n, mu)
+    result_mul_number = blocks_to_number(result_mul)
+    print("Результат множення за модулем:")
+    print(f"(num1 * num2) mod n: {result_mul_number}\n")
+
+    result_square = LongMulSquareMod(a, n, mu)
+    result_square_number = blocks_to_number(result_square)
+    print("Результат піднесення до квадрату за модулем:")
+    print(f"(num1^2) mod n: {result_square_number}\n")
+
+    #result_power = LongModPowerBarrett(a, b1, n)
+    #result_power_hex = blocks_to_number(result_power)
+    #print("Результат піднесення до степеня за модулем:")
+    #print(f"(num1^num2) mod n: {result_power_hex}\n")
+
+    avg_times = benchmark_operations(a, b, n, mu, num_trials=10)
+
+    for operation, avg_time in avg_times.items():
+        print(f"Середній час для {operation}: {avg_time:.6f} секунд")
+
+
+def verify_identities(field, a, b, c, d, m):
+    a, b, c, d = (field.element(x) for x in (a, b, c, d))
+    zero = field.zero
+    one = field.one
+
+    # Тотожність 1: (a + b) * c = b * c + c * a
+    left = field.multiply(field.add(a, b), c)
+    right = field.add(field.multiply(b, c), field.multiply(c, a))
+    identity_1 = (left == right)
+
+    # Тотожність 2: d^(2^m - 1) = 1 (для d ≠ 0)
+    if d != zero:
+        power_exp = (1 << m) - 1  # 2^m - 1
+        d_power = field.power(d, power_exp)
+        identity_2 = (d_power == one)
+    else:
+        identity_2 = None
+
+    return identity_1, identity_2
+
+def measure_time_for_operations(field, a, b, m, num_trials=1000):
+    a, b = field.element(a), field.element(b)
+    times = {
+        "Addition": [],
+        "Multiplication": [],
+        "Square": [],
+        "Inverse": [],
+        "Power": [],
+        "Trace": []
+    }
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        field.add(a, b)
+        end = time.perf_counter()
+        times["Addition"].append(end - start)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        field.multiply(a, b)
+        end = time.perf_counter()
+        times["Multiplication"].append(end - start)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        field.square(a)
+        end = time.perf_counter()
+        times["Square"].append(end - start)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        field.inverse(a)
+        end = time.perf_counter()
+        times["Inverse"].append(end - start)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        field.power(a, int('1001', 2))  
+        end = time.perf_counter()
+        times["Power"].append(end - start)
+
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        field.trace(a)
+        end = time.perf_counter()
+        times["Trace"].append(end - start)
+
+    avg_times = {operation: sum(times_list) / len(times_list) for operation, times_list in times.items()}
+
+    return avg_times
+
+
+def gf2m_demo():
+    """Демонстрація лабораторної 3: GF(2^m) у поліноміальному базисі"""
+    m = 173
+    irreducible_poly = (1 << 173) | (1 << 10) | (1 << 2) | (1 << 1) | 1  # x^173 + x^10 + x^2 + x + 1
+    field = GaloisField(m, irreducible_poly)
+
+    a = '00011001010000111101100011100000111001110100011000110010101100111010110010010101101110000111110010101011001000101110110110011111010101111101110101000000110010010110011111101'
+    b = '01110000010011010011000001010000010100010011011011101000100010100000111101011101100000010001011101100010010001101000100010110111011001100101010010100010000101011100101100011'
+    n = '00000110110010100110001110101111001001000000000110100011000000011001111111010010000001111010010001111100000100001101011100100110110000100100010010000101100011110101010100111'
+
+    a, b, n = field.element(a), field.element(b), field.element(n)
+    addition = field.add(a, b)
+    multiplication = field.multiply(a, b)
+    square_a = field.square(a)
+    inverse_a = field.inverse(a)
+    power_n = field.power_n(a, n)
+    trace_a = field.trace(a)
+
+    print(f"A + B: {field.to_bitstring(addition)}")
+    print(f"A * B: {field.to_bitstring(multiplication)}")
+    print(f"A^2: {field.to_bitstring(square_a)}")
+    print(f"A^(-1): {field.to_bitstring(inverse_a)}")
+    print(f"A^N: {field.to_bitstring(power_n)}")
+    print(f"Trace: {trace_a}")
+
+
+    print('------------------Testing------------------')
+
+    a = '01101010101101101001011010011111100001101101010111110100100001010000001100011000111001111001100011110111001100000100111011101000010101111010101000100101011110100111000111010'
+    b = '00010000000101110010010010110000110110100111011100111110110100011010100010001011000011110011111101110000000011000011010010110001100101001100100011001110001110000011000001011'
+    c = '010010110100110100101111111101110110010011110011110010100111000110110111011011011110010010010111000110111101011011110000100101110011010101101111010010100101101110001110000001100111010010'
+    d = '1010011110001000110111110101101100111001010100100110100001111000111001111000111111111101000000000001010101001011111001011011001001010101111101011001000111101011111111111111011011100100'
+
+    identity_1, identity_2 = verify_identities(field, a, b, c, d, m)
+
+    print(f"Тотожність 1 ((a + b) * c = b * c + c * a): {'Виконується' if identity_1 else 'Не виконується'}")
+    if identity_2 is not None:
+        print(f"Тотожність 2 (d^(2^m - 1) = 1): {'Виконується' if identity_2 else 'Не виконується'}")
+    else:
+        print("Тотожність 2 не перевіряється, оскільки d = 0.")
+
+
+    print('------------------Time Testing------------------')
+    m = 173
+    irreducible_poly = (1 << 173) | (1 << 10) | (1 << 2) | (1 << 1) | 1
+    field = GaloisField(m, irreducible_poly)
+
+    a = '01101010101101101001011010011111100001101101010111110100100001010000001100011000111001111001100011110111001100000100111011101000010101111010101000100101011110100111000111010'
+    b = '00010000000101110010010010110000110110100111011100111110110100011010100010001011000011110011111101110000000011000011010010110001100101001100100011001110001110000011000001011'
+
+    avg_times = measure_time_for_operations(field, a, b, m)
+
+    for operation, avg_time in avg_times.items():
+        print(f"{operation}: {avg_time:.20f}")
+
+
+def onb_demo():
+    """Демонстрація лабораторної 4: GF(2^m) в оптимальному нормальному базисі"""
+    m = 173
+    irreducible_poly = (1 << 173) | (1 << 10) | (1 << 2) | (1 << 1) | 1  # x^173 + x^10 + x^2 + x + 1
+    field = GaloisFieldONB(m)
+
+    a = '00100010110000100001011000000100100001001111110001001010100111101001111011101111001000000101110011010101011111100100111101000001101010000001010001000000011110001011000101001'
+    b = '11001111111111101001100111010110011101100000100100000001010100110011011100000100111111010101011100111111101111111101100001001110010001000100011111101111110111001001000111010'
+    n = '01001001110101110001011101000100000111001011010111101100100011101111010010011111110001011011000000110111001000110101000101000000100000011011110101100011011001010011000010110'
+
+    addition = field.add(int(a, 2), int(b, 2))
+    square_a = field.square(int(a, 2))
+    trace_a = field.trace(int(a, 2))
+    multiplication = field.mul(int(a, 2), int(b, 2))
+    power_n = field.power_n(int(a, 2), int(n, 2))
+    inverse_a = field.inverse(int(a, 2))
+
+
+    print(f"A + B: {format(addition, f'0{m}b')}")
+    print(f"A^2: {format(square_a, f'0{m}b')}")
+    print(f"Trace A: {trace_a}")
+    print(f"A * B: {format(multiplication, f'0{m}b')}")
+    print(f"A^N: {format(power_n, f'0{m}b')}")
+    print(f"A^(-1): {format(inverse_a, f'0{m}b')}")
+
+
+DEMOS = {
+    "longarith": longarith_demo,
+    "gf2m": gf2m_demo,
+    "onb": onb_demo,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1 or argv[0] not in DEMOS:
+        print(f"usage: python -m srom {{{'|'.join(DEMOS)}}}", file=sys.stderr)
+        return 2
+    DEMOS[argv[0]]()
+    return 0
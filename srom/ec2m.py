@@ -0,0 +1,282 @@
+"""Еліптичні криві y^2 + xy = x^3 + ax^2 + b над GF(2^m) у поліноміальному базисі
+
+Точки ззовні — афінні пари (x, y) або None для нескінченно віддаленої точки.
+Всередині обчислення ведуться в координатах Лопеса–Дахаба (X, Y, Z):
+x = X/Z, y = Y/Z^2, тож додавання і подвоєння не потребують інверсій.
+"""
+from .gf2m import GaloisField
+
+WNAF_WINDOW = 4
+FIXED_BASE_WINDOW = 4
+SCALAR_METHODS = ("wnaf", "ladder")
+_LD_INFINITY = (1, 0, 0)
+
+
+class BinaryCurve:
+    def __init__(self, field, a, b, order=None):
+        if not isinstance(field, GaloisField):
+            raise ValueError("Curve requires a polynomial-basis GaloisField")
+        if b == 0:
+            raise ValueError("Curve is singular for b = 0")
+        self.field = field
+        self.a = a
+        self.b = b
+        self.order = order
+        self.nbytes = (field.m + 7) // 8
+
+    def _mul_a(self, t):
+        if self.a == 0:
+            return 0
+        if self.a == 1:
+            return t
+        return self.field.multiply(self.a, t)
+
+    def is_on_curve(self, P):
+        if P is None:
+            return True
+        f = self.field
+        x, y = P
+        x2 = f.square(x)
+        return f.square(y) ^ f.multiply(x, y) == f.multiply(x2, x) ^ f.multiply(self.a, x2) ^ self.b
+
+    def negate(self, P):
+        if P is None:
+            return None
+        return P[0], P[0] ^ P[1]
+
+    # Координати Лопеса–Дахаба
+
+    def to_ld(self, P):
+        return _LD_INFINITY if P is None else (P[0], P[1], 1)
+
+    def to_affine(self, P):
+        X, Y, Z = P
+        if Z == 0:
+            return None
+        f = self.field
+        z_inv = f.inverse(Z)
+        return f.multiply(X, z_inv), f.multiply(Y, f.square(z_inv))
+
+    def _normalize_many(self, points):
+        """Переведення списку точок ЛД в афінні однією інверсією (трюк Монтгомері)"""
+        f = self.field
+        finite = [i for i, P in enumerate(points) if P[2] != 0]
+        inverses = f.inverse_many([points[i][2] for i in finite])
+        result = [None] * len(points)
+        for i, z_inv in zip(finite, inverses):
+            X, Y, _ = points[i]
+            result[i] = (f.multiply(X, z_inv), f.multiply(Y, f.square(z_inv)))
+        return result
+
+    def ld_double(self, P):
+        """Подвоєння в координатах ЛД: 4M + 5S"""
+        X1, Y1, Z1 = P
+        if Z1 == 0 or X1 == 0:
+            return _LD_INFINITY
+        f = self.field
+        X1s, Z1s = f.square(X1), f.square(Z1)
+        bZ4 = f.multiply(self.b, f.square(Z1s))
+        Z3 = f.multiply(X1s, Z1s)
+        X3 = f.square(X1s) ^ bZ4
+        Y3 = f.multiply(bZ4, Z3) ^ f.multiply(X3, self._mul_a(Z3) ^ f.square(Y1) ^ bZ4)
+        return X3, Y3, Z3
+
+    def ld_add_mixed(self, P, Q):
+        """Змішане додавання: P у координатах ЛД, Q афінна; 8M + 5S"""
+        if Q is None:
+            return P
+        X1, Y1, Z1 = P
+        x2, y2 = Q
+        if Z1 == 0:
+            return x2, y2, 1
+        f = self.field
+        Z1s = f.square(Z1)
+        A = f.multiply(y2, Z1s) ^ Y1
+        B = f.multiply(x2, Z1) ^ X1
+        if B == 0:
+            return self.ld_double((x2, y2, 1)) if A == 0 else _LD_INFINITY
+        C = f.multiply(Z1, B)
+        D = f.multiply(f.square(B), C ^ self._mul_a(Z1s))
+        Z3 = f.square(C)
+        E = f.multiply(A, C)
+        X3 = f.square(A) ^ D ^ E
+        F = X3 ^ f.multiply(x2, Z3)
+        G = f.multiply(x2 ^ y2, f.square(Z3))
+        Y3 = f.multiply(E ^ Z3, F) ^ G
+        return X3, Y3, Z3
+
+    # Афінні операції
+
+    def add(self, P, Q):
+        return self.to_affine(self.ld_add_mixed(self.to_ld(P), Q))
+
+    def double(self, P):
+        return self.to_affine(self.ld_double(self.to_ld(P)))
+
+    # Скалярне множення
+
+    def multiply(self, P, k, method="wnaf", w=WNAF_WINDOW):
+        """kP методом wNAF (за замовчуванням) або сходами Монтгомері"""
+        if method not in SCALAR_METHODS:
+            raise ValueError(f"Unknown scalar multiplication method: {method}")
+        if w < 2:
+            raise ValueError("wNAF window must be at least 2")
+        if self.order is not None:
+            k %= self.order
+        if k < 0:
+            k, P = -k, self.negate(P)
+        if k == 0 or P is None:
+            return None
+        if method == "ladder":
+            return self._multiply_ladder(P, k)
+        return self._multiply_wnaf(P, k, w)
+
+    def _multiply_wnaf(self, P, k, w):
+        digits = _wnaf(k, w)
+        # непарні кратні P, 3P, ..., (2^(w-1) - 1)P в афінних координатах
+        twice = self.double(P)
+        odd = [self.to_ld(P)]
+        for _ in range((1 << (w - 2)) - 1):
+            odd.append(self.ld_add_mixed(odd[-1], twice))
+        table = self._normalize_many(odd)
+        Q = _LD_INFINITY
+        for digit in reversed(digits):
+            Q = self.ld_double(Q)
+            if digit > 0:
+                Q = self.ld_add_mixed(Q, table[digit >> 1])
+            elif digit < 0:
+                Q = self.ld_add_mixed(Q, self.negate(table[-digit >> 1]))
+        return self.to_affine(Q)
+
+    def _multiply_ladder(self, P, k):
+        """Сходи Монтгомері на x-координатах у ЛД-формі (Лопес–Дахаб) з відновленням y"""
+        f = self.field
+        x, y = P
+        if x == 0:  # точка порядку 2
+            return P if k & 1 else None
+        X1, Z1 = x, 1
+        Z2 = f.square(x)
+        X2 = f.square(Z2) ^ self.b
+        for i in range(k.bit_length() - 2, -1, -1):
+            if (k >> i) & 1:
+                X1, Z1 = self._ladder_add(X1, Z1, X2, Z2, x)
+                X2, Z2 = self._ladder_double(X2, Z2)
+            else:
+                X2, Z2 = self._ladder_add(X2, Z2, X1, Z1, x)
+                X1, Z1 = self._ladder_double(X1, Z1)
+        # (X1 : Z1) = kP, (X2 : Z2) = (k + 1)P
+        if Z1 == 0:
+            return None
+        if Z2 == 0:
+            return x, x ^ y
+        Z1Z2 = f.multiply(Z1, Z2)
+        inv = f.inverse(f.multiply(x, Z1Z2))
+        x3 = f.multiply(f.multiply(X1, f.multiply(x, Z2)), inv)
+        t = f.multiply(X1 ^ f.multiply(x, Z1), X2 ^ f.multiply(x, Z2)) ^ f.multiply(f.square(x) ^ y, Z1Z2)
+        y3 = f.multiply(f.multiply(x ^ x3, t), inv) ^ y
+        return x3, y3
+
+    def _ladder_add(self, X1, Z1, X2, Z2, x):
+        f = self.field
+        t1, t2 = f.multiply(X1, Z2), f.multiply(X2, Z1)
+        Z3 = f.square(t1 ^ t2)
+        return f.multiply(x, Z3) ^ f.multiply(t1, t2), Z3
+
+    def _ladder_double(self, X, Z):
+        f = self.field
+        X2, Z2 = f.square(X), f.square(Z)
+        return f.square(X2) ^ f.multiply(self.b, f.square(Z2)), f.multiply(X2, Z2)
+
+    # Стиснення точок (формат SEC 1)
+
+    def compress(self, P):
+        """Стиснена точка: 0x02 | y~, далі x; y~ — молодший біт y/x"""
+        if P is None:
+            return b'\x00'
+        x, y = P
+        bit = 0 if x == 0 else self.field.multiply(y, self.field.inverse(x)) & 1
+        return bytes([2 | bit]) + x.to_bytes(self.nbytes, 'big')
+
+    def decompress(self, data):
+        """Відновлення точки: z^2 + z = x + a + b/x^2, y = x*z"""
+        if data == b'\x00':
+            return None
+        if len(data) != self.nbytes + 1 or data[0] not in (2, 3):
+            raise ValueError("Invalid compressed point encoding")
+        f = self.field
+        bit = data[0] & 1
+        x = int.from_bytes(data[1:], 'big')
+        if x >> f.m:
+            raise ValueError("Invalid compressed point encoding")
+        if x == 0:
+            return 0, f.square_k(self.b, f.m - 1)  # y = sqrt(b)
+        beta = x ^ self.a ^ f.multiply(self.b, f.inverse(f.square(x)))
+        z = f.solve_quadratic(beta)
+        if z is None:
+            raise ValueError("Point is not on the curve")
+        if z & 1 != bit:
+            z ^= 1
+        return x, f.multiply(x, z)
+
+
+class FixedBaseTable:
+    """Таблиця для фіксованої точки P: рядок i містить d * 2^(w*i) * P, d < 2^w
+
+    Множення kP зводиться до суми по одній точці з кожного рядка: ceil(max_bits / w)
+    змішаних додавань без жодного подвоєння.
+    """
+
+    def __init__(self, curve, P, w=FIXED_BASE_WINDOW, max_bits=None):
+        if w < 1:
+            raise ValueError("Fixed-base window must be positive")
+        self.curve = curve
+        self.P = P
+        self.w = w
+        if max_bits is None:
+            max_bits = curve.order.bit_length() if curve.order else curve.field.m + 1
+        self.max_bits = max_bits
+        self.rows = []
+        base = P
+        for _ in range(-(-max_bits // w)):
+            if base is None:
+                self.rows.append([None] * (1 << w))
+                continue
+            row = [_LD_INFINITY, curve.to_ld(base)]
+            for _ in range(2, 1 << w):
+                row.append(curve.ld_add_mixed(row[-1], base))
+            row.append(curve.ld_double(row[1 << (w - 1)]))  # 2^w * base для наступного рядка
+            row = curve._normalize_many(row)
+            base = row.pop()
+            self.rows.append(row)
+
+    def multiply(self, k):
+        curve = self.curve
+        if curve.order is not None:
+            k %= curve.order
+        if k < 0:
+            return curve.negate(self.multiply(-k))
+        if k.bit_length() > self.max_bits:
+            return curve.multiply(self.P, k)
+        mask = (1 << self.w) - 1
+        Q = _LD_INFINITY
+        for row in self.rows:
+            if k & mask:
+                Q = curve.ld_add_mixed(Q, row[k & mask])
+            k >>= self.w
+        return curve.to_affine(Q)
+
+
+def _wnaf(k, w):
+    """Цифри wNAF числа k > 0, від молодшої; ненульові цифри непарні, |d| < 2^(w-1)"""
+    digits = []
+    while k:
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
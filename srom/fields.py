@@ -0,0 +1,141 @@
+"""Реєстр полів GF(2^m): кожне поле з ключем (базис, m, модуль) будується один раз
+
+Поля зберігаються в LRU-кеші процесу. Якщо задано каталог кешу (аргумент cache_dir
+або змінна середовища SROM_FIELD_CACHE), передобчислені параметри полів записуються
+туди як .npy-файли і при наступних запусках відкриваються через mmap замість
+перебудови. Кеш на диску потребує NumPy; реєстр у пам'яті працює і без нього.
+"""
+import os
+import tempfile
+from collections import OrderedDict
+
+from ._lazy import LazyModule
+from .gf2m import GaloisField
+from .onb import GaloisFieldONB
+
+np = LazyModule("numpy")
+
+FIELD_CACHE_SIZE = 32
+CACHE_DIR_ENV = "SROM_FIELD_CACHE"
+BASES = ("polynomial", "onb")
+_field_cache = OrderedDict()
+
+
+def get_field(m, irreducible_poly=None, basis=None, cache_dir=None):
+    """Поле з реєстру: поліноміальний базис за модулем або ONB (якщо модуль не заданий)"""
+    if basis is None:
+        basis = "onb" if irreducible_poly is None else "polynomial"
+    if basis not in BASES:
+        raise ValueError(f"Unknown basis: {basis}")
+    if basis == "polynomial" and irreducible_poly is None:
+        raise ValueError("Polynomial basis requires an irreducible polynomial")
+    key = (basis, m, irreducible_poly if basis == "polynomial" else None)
+    field = _field_cache.get(key)
+    if field is None:
+        field = _build_field(key, _cache_dir(cache_dir))
+        _field_cache[key] = field
+        while len(_field_cache) > FIELD_CACHE_SIZE:
+            _field_cache.popitem(last=False)
+    else:
+        _field_cache.move_to_end(key)
+    return field
+
+
+def clear_field_cache():
+    """Очищення реєстру в пам'яті (файли на диску не видаляються)"""
+    _field_cache.clear()
+
+
+def save_field(field, cache_dir=None):
+    """Запис передобчислених параметрів поля в каталог кешу"""
+    cache_dir = _cache_dir(cache_dir)
+    if cache_dir is None:
+        raise ValueError(f"No cache directory: pass cache_dir or set {CACHE_DIR_ENV}")
+    os.makedirs(cache_dir, exist_ok=True)
+    if isinstance(field, GaloisFieldONB):
+        width = max(1, max(map(len, field.lambda_rows)))
+        rows = np.full((field.m, width), -1, dtype=np.int32)
+        for i, row in enumerate(field.lambda_rows):
+            rows[i, :len(row)] = row
+        _save_array(_path(cache_dir, _stem(field), "lambda"), rows)
+        return
+    params = field.export_params()
+    stem = _stem(field)
+    _save_array(_path(cache_dir, stem, "trace"), _int_to_array(params["trace_mask"], field.nbytes))
+    _save_array(_path(cache_dir, stem, "inv"), np.array(params["inv_method"]))
+    for k, table in params["square_k_tables"].items():
+        rows = [[_int_to_array(value, field.nbytes) for value in row] for row in table]
+        _save_array(_path(cache_dir, stem, f"sqk{k}"), np.array(rows, dtype=np.uint8))
+
+
+def _build_field(key, cache_dir):
+    basis, m, irreducible_poly = key
+    if basis == "onb":
+        field = None
+        if cache_dir is not None:
+            path = _path(cache_dir, f"onb-{m}", "lambda")
+            if os.path.exists(path):
+                rows = np.load(path, mmap_mode="r")
+                field = GaloisFieldONB(m, lambda_rows=[[int(j) for j in row if j >= 0] for row in rows])
+        if field is None:
+            field = GaloisFieldONB(m)
+            if cache_dir is not None:
+                save_field(field, cache_dir)
+        return field
+
+    field = GaloisField(m, irreducible_poly)
+    if cache_dir is None:
+        return field
+    stem = _stem(field)
+    trace_path = _path(cache_dir, stem, "trace")
+    if not os.path.exists(trace_path):
+        save_field(field, cache_dir)
+        return field
+    params = {"trace_mask": _array_to_int(np.load(trace_path, mmap_mode="r"))}
+    inv_path = _path(cache_dir, stem, "inv")
+    if os.path.exists(inv_path):
+        params["inv_method"] = str(np.load(inv_path))
+    tables = {}
+    prefix = f"{stem}.sqk"
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name.endswith(".npy"):
+            k = int(name[len(prefix):-4])
+            data = np.load(os.path.join(cache_dir, name), mmap_mode="r")
+            tables[k] = [[_array_to_int(value) for value in row] for row in data]
+    params["square_k_tables"] = tables
+    field.import_params(params)
+    return field
+
+
+def _cache_dir(cache_dir):
+    return cache_dir if cache_dir is not None else os.environ.get(CACHE_DIR_ENV)
+
+
+def _stem(field):
+    if isinstance(field, GaloisFieldONB):
+        return f"onb-{field.m}"
+    return f"gf2m-{field.m}-{field.irreducible_poly:x}"
+
+
+def _path(cache_dir, stem, item):
+    return os.path.join(cache_dir, f"{stem}.{item}.npy")
+
+
+def _save_array(path, array):
+    """Атомарний запис .npy: інший процес ніколи не побачить напівзаписаний файл"""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _int_to_array(value, nbytes):
+    return np.frombuffer(value.to_bytes(nbytes, "little"), dtype=np.uint8)
+
+
+def _array_to_int(array):
+    return int.from_bytes(np.asarray(array, dtype=np.uint8).tobytes(), "little")
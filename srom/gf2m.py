@@ -0,0 +1,295 @@
+import time
+
+SPARSE_MAX_TERMS = 5  # триноми та пентаноми редукуються згортками
+COMB_WINDOW = 4
+MUL_METHODS = ("comb", "serial")
+INV_METHODS = ("auto", "itoh-tsujii", "euclid")
+# байт -> 16 біт з нулями між бітами (x^i -> x^(2i)), little-endian
+_SPREAD = tuple(int('0'.join(format(v, '08b')), 2).to_bytes(2, 'little') for v in range(256))
+
+
+class GaloisField:
+    """Поле GF(2^m) у поліноміальному базисі; елементи — цілі числа (біт i — коефіцієнт при x^i)"""
+
+    def __init__(self, m, irreducible_poly, mul_method="comb", window=COMB_WINDOW, inv_method="auto"):
+        if mul_method not in MUL_METHODS:
+            raise ValueError(f"Unknown multiplication method: {mul_method}")
+        if inv_method not in INV_METHODS:
+            raise ValueError(f"Unknown inversion method: {inv_method}")
+        if window < 1:
+            raise ValueError("Comb window must be positive")
+        self.m = m
+        self.irreducible_poly = irreducible_poly
+        self.modulus = 1 << m
+        self.mask = self.modulus - 1
+        self.zero = 0
+        self.one = 1
+        # x^m = сума x^e за e з low_terms (mod f), звідси редукція згортками
+        self.low_terms = tuple(e for e in range(m) if (irreducible_poly >> e) & 1)
+        self.sparse = irreducible_poly >> m == 1 and len(self.low_terms) + 1 <= SPARSE_MAX_TERMS
+        self.mul_method = mul_method
+        self.window = window
+        self.inv_method = inv_method
+        self.nbytes = (m + 7) // 8
+        self._square_k_tables = {}
+        self._trace_mask = None
+
+    def export_params(self):
+        """Передобчислені параметри поля: маска сліду, метод інверсії, таблиці square_k"""
+        if self.inv_method == "auto":
+            self.inv_method = self._select_inverse_method()
+        return {
+            "trace_mask": self.trace_mask,
+            "inv_method": self.inv_method,
+            "square_k_tables": dict(self._square_k_tables),
+        }
+
+    def import_params(self, params):
+        """Відновлення параметрів, збережених export_params"""
+        if "trace_mask" in params:
+            self._trace_mask = params["trace_mask"]
+        if "inv_method" in params:
+            self.inv_method = params["inv_method"]
+        self._square_k_tables.update(params.get("square_k_tables", {}))
+
+    def element(self, a):
+        """Елемент поля з m-бітного рядка або числа (межа введення)"""
+        if isinstance(a, str):
+            return int(a, 2)
+        return a
+
+    def to_bitstring(self, a):
+        """Перетворення елемента у m-бітний рядок"""
+        if isinstance(a, str):
+            a = int(a, 2)
+        return format(a, f'0{self.m}b')
+
+    def from_bitstring(self, bitstring):
+        """Перетворити m-бітний рядок в елемент"""
+        return int(bitstring, 2)
+
+    def add(self, a, b):
+        """Додавання у поліноміальному базисі"""
+        return a ^ b
+
+    def module(self, result):
+        """Редукція числа по поліному в полі"""
+        if self.sparse:
+            return self._reduce_sparse(result)
+        return self._reduce_generic(result)
+
+    def _reduce_sparse(self, t):
+        """Редукція по розрідженому модулю: старша частина t згортається зсувами на e з low_terms"""
+        m, mask, terms = self.m, self.mask, self.low_terms
+        while t >> m:
+            high = t >> m
+            t &= mask
+            for e in terms:
+                t ^= high << e
+        return t
+
+    def _reduce_generic(self, t):
+        """Побітова редукція для щільних модулів"""
+        poly_len = self.irreducible_poly.bit_length()
+        while t.bit_length() >= poly_len:
+            t ^= self.irreducible_poly << (t.bit_length() - poly_len)
+        return t
+
+    def multiply(self, a, b):
+        """Множення у GF(2^m)"""
+        if self.mul_method == "comb":
+            return self.module(self._clmul_comb(a, b))
+        return self.module(self._clmul_serial(a, b))
+
+    def _clmul_serial(self, a, b):
+        """Побітове множення многочленів без переносів (зсув і додавання)"""
+        result = 0
+        for i in range(b.bit_length()):
+            if (b >> i) & 1:
+                result ^= a
+            a <<= 1
+        return result
+
+    def _clmul_comb(self, a, b):
+        """Множення гребенем зліва направо: w-бітні вікна b з таблицею кратних a"""
+        w = self.window
+        size = 1 << w
+        table = [0, a] + [0] * (size - 2)
+        for i in range(2, size):
+            table[i] = table[i - 1] ^ a if i & 1 else table[i >> 1] << 1
+        mask = size - 1
+        result = 0
+        for shift in range((b.bit_length() - 1) // w * w, -1, -w):
+            result = (result << w) ^ table[(b >> shift) & mask]
+        return result
+
+    def square(self, a):
+        """Піднесення елементу до квадрата у GF(2^m): розрідження бітів і редукція"""
+        spread = b''.join([_SPREAD[byte] for byte in a.to_bytes((a.bit_length() + 7) // 8, 'little')])
+        return self.module(int.from_bytes(spread, 'little'))
+
+    def square_k(self, a, k, table=None):
+        """a^(2^k): k піднесень до квадрата або одне застосування таблиці square_k_table(k)"""
+        if table is not None:
+            if a >> self.m:
+                a = self.module(a)
+            result = 0
+            for row, byte in zip(table, a.to_bytes(self.nbytes, 'little')):
+                if byte:
+                    result ^= row[byte]
+            return result
+        for _ in range(k):
+            a = self.square(a)
+        return a
+
+    def square_k_table(self, k):
+        """Таблиця лінійного відображення a -> a^(2^k): для кожного байта a всі 256 образів"""
+        table = self._square_k_tables.get(k)
+        if table is None:
+            table = []
+            for j in range(self.nbytes):
+                basis = [self.square_k(1 << (8 * j + i), k) if 8 * j + i < self.m else 0 for i in range(8)]
+                row = [0] * 256
+                for v in range(1, 256):
+                    low = v & -v
+                    row[v] = row[v ^ low] ^ basis[low.bit_length() - 1]
+                table.append(row)
+            self._square_k_tables[k] = table
+        return table
+
+    def power(self, base, exp):
+        """Піднесення елемента до степеня"""
+        result = 1
+        for _ in range(exp.bit_length()):
+            if exp & 1:
+                result = self.multiply(result, base)
+            base = self.square(base)
+            exp >>= 1
+        return result
+
+    def power_n(self, a, n):
+        """Піднесення елемента до степеня n"""
+        return self.power(a, n)
+
+    def inverse(self, a):
+        """Знаходження оберненого елемента у поліноміальному базисі"""
+        if a >> self.m:
+            a = self.module(a)
+        if a == 0:
+            raise ValueError("Element 0 is not invertible")
+        if self.inv_method == "auto":
+            self.inv_method = self._select_inverse_method()
+        if self.inv_method == "euclid":
+            return self._inverse_euclid(a)
+        return self._inverse_itoh_tsujii(a)
+
+    def _inverse_itoh_tsujii(self, a):
+        """Ітох–Цудзії: a^(2^(m-1)-1) ланцюжком додавань по бітах m-1, далі квадрат"""
+        n = self.m - 1
+        beta, k = a, 1  # beta = a^(2^k - 1)
+        for i in range(n.bit_length() - 2, -1, -1):
+            beta = self.multiply(self.square_k(beta, k), beta)
+            k <<= 1
+            if (n >> i) & 1:
+                beta = self.multiply(self.square(beta), a)
+                k += 1
+        return self.square(beta)
+
+    def _inverse_euclid(self, a):
+        """Розширений алгоритм Евкліда для многочленів: g1*a = u (mod f) до u = 1"""
+        u, v = a, self.irreducible_poly
+        g1, g2 = 1, 0
+        while u != 1:
+            j = u.bit_length() - v.bit_length()
+            if j < 0:
+                u, v, g1, g2, j = v, u, g2, g1, -j
+            u ^= v << j
+            g1 ^= g2 << j
+        return g1
+
+    def _select_inverse_method(self, trials=3):
+        """Вибір швидшого з двох методів інверсії для цього поля за заміром часу"""
+        sample = self.mask ^ (self.mask >> 1) | 1
+        best = None
+        for method, func in (("itoh-tsujii", self._inverse_itoh_tsujii), ("euclid", self._inverse_euclid)):
+            elapsed = float("inf")
+            for _ in range(trials):
+                start = time.perf_counter()
+                func(sample)
+                elapsed = min(elapsed, time.perf_counter() - start)
+            if best is None or elapsed < best[1]:
+                best = (method, elapsed)
+        return best[0]
+
+    def inverse_many(self, elements):
+        """Пакетна інверсія трюком Монтгомері: одна інверсія та 3(k-1) множень"""
+        elements = [self.module(a) if a >> self.m else a for a in elements]
+        if not elements:
+            return []
+        prefix = [elements[0]]
+        for a in elements[1:]:
+            prefix.append(self.multiply(prefix[-1], a))
+        if prefix[-1] == 0:
+            raise ValueError("Element 0 is not invertible")
+        inv = self.inverse(prefix[-1])
+        result = [0] * len(elements)
+        for i in range(len(elements) - 1, 0, -1):
+            result[i] = self.multiply(inv, prefix[i - 1])
+            inv = self.multiply(inv, elements[i])
+        result[0] = inv
+        return result
+
+    @property
+    def trace_mask(self):
+        """Маска tau: біт i дорівнює Tr(x^i), тож Tr(a) = parity(a & tau)"""
+        if self._trace_mask is None:
+            # тотожності Ньютона для степеневих сум коренів f: s_k = sum a_i s_(k-i) + k a_k,
+            # де a_i — коефіцієнт при x^(m-i); s_k = Tr(x^k)
+            m = self.m
+            coeffs = [i for i in range(1, m + 1) if (self.irreducible_poly >> (m - i)) & 1]
+            sums = [m & 1]
+            for k in range(1, m):
+                s_k = k & 1 if k in coeffs else 0
+                for i in coeffs:
+                    if i >= k:
+                        break
+                    s_k ^= sums[k - i]
+                sums.append(s_k)
+            self._trace_mask = sum(bit << i for i, bit in enumerate(sums))
+        return self._trace_mask
+
+    def trace(self, a):
+        """Слід елемента: a + a^2 + ... + a^(2^(m-1)) = parity(a & tau)"""
+        if a >> self.m:
+            a = self.module(a)
+        return (a & self.trace_mask).bit_count() & 1
+
+    def half_trace(self, c):
+        """Напівслід для непарного m: c + c^4 + c^16 + ... + c^(4^((m-1)/2))"""
+        if not self.m & 1:
+            raise ValueError("Half-trace is defined only for odd m")
+        if c >> self.m:
+            c = self.module(c)
+        result = c
+        for _ in range((self.m - 1) // 2):
+            c = self.square(self.square(c))
+            result ^= c
+        return result
+
+    def solve_quadratic(self, c):
+        """Розв'язок z рівняння z^2 + z = c (другий — z + 1) або None, якщо Tr(c) = 1"""
+        if c >> self.m:
+            c = self.module(c)
+        if self.trace(c):
+            return None
+        if self.m & 1:
+            return self.half_trace(c)
+        # парне m (IEEE 1363, A.4.7): потрібен елемент delta зі слідом 1
+        tau = self.trace_mask
+        delta = tau & -tau
+        z, w = 0, c
+        for _ in range(1, self.m):
+            w2 = self.square(w)
+            z = self.square(z) ^ self.multiply(w2, delta)
+            w = w2 ^ c
+        return z
@@ -0,0 +1,1240 @@
+import os
+import sys
+from array import array
+from collections import OrderedDict
+
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+
+_LIMB_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+
+class LimbVector(array):
+    """32-бітні цифри числа (молодша перша) у компактному array з буферним протоколом
+
+    Перетворення з int та bytes і назад виконуються за лінійний час без
+    створення окремого Python int для кожної цифри.
+    """
+
+    def __new__(cls, limbs=()):
+        return super().__new__(cls, _LIMB_TYPECODE, limbs)
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Цифри з буфера у порядку little-endian, по 4 байти на цифру"""
+        result = cls()
+        result.frombytes(memoryview(buffer).cast('B'))
+        if sys.byteorder == 'big':
+            result.byteswap()
+        return result
+
+    @classmethod
+    def from_bytes(cls, data, byteorder='big'):
+        if byteorder == 'little' and len(data) % 4 == 0:
+            return cls.from_buffer(data)
+        return cls.from_int(int.from_bytes(data, byteorder))
+
+    @classmethod
+    def from_int(cls, num):
+        if num < 0:
+            raise ValueError("Negative numbers are not supported")
+        return cls.from_buffer(num.to_bytes(4 * ((num.bit_length() + 31) // 32), 'little'))
+
+    def to_bytes(self, byteorder='big', length=None):
+        num = self.to_int()
+        if length is None:
+            length = (num.bit_length() + 7) // 8
+        return num.to_bytes(length, byteorder)
+
+    def to_int(self):
+        data = self
+        if sys.byteorder == 'big':
+            data = array(_LIMB_TYPECODE, self)
+            data.byteswap()
+        return int.from_bytes(data.tobytes(), 'little')
+
+def _LimbsToInt(A):
+    if not isinstance(A, LimbVector):
+        A = LimbVector(A)
+    return A.to_int()
+
+def to_base_2_32(num):
+    if isinstance(num, LimbVector):
+        return num.tolist()
+    return LimbVector.from_int(num).tolist()
+
+def hex_to_blocks(hex_value, base=2**32):
+    r = int(hex_value, 16)
+    if base == 2 ** 32:
+        return to_base_2_32(r)
+    blocks = []
+    while r > 0:
+        blocks.append(r % base)
+        r //= base
+    return blocks
+
+def blocks_to_number(blocks, base=2**32):
+    if base == 2 ** 32:
+        return hex(_LimbsToInt(blocks))
+    num = 0
+    for i, block in enumerate(blocks):
+        num = num + block * (base ** i)
+    return hex(num)
+
+def LongAdd(A, B, w = 32):
+    n = max(len(A), len(B))
+    C = [0] * n
+    carry = 0
+    for i in range(n):
+        a_i = A[i] if i < len(A) else 0
+        b_i = B[i] if i < len(B) else 0
+        temp = a_i + b_i + carry
+        C[i] = temp & (2**w - 1)
+        carry = temp >> w
+    return C
+
+def LongSub(A, B, w=32):
+    n = max(len(A), len(B))
+    C = [0] * n
+    borrow = 0
+    for i in range(n):
+        a_i = A[i] if i < len(A) else 0
+        b_i = B[i] if i < len(B) else 0
+        temp = a_i - b_i - borrow
+        if temp >= 0:
+            C[i] = temp
+            borrow = 0
+        else:
+            C[i] = (1 << w) + temp
+            borrow = 1
+    return C
+
+def LongCmp(A, B):
+    n = max(len(A), len(B))
+    i = n - 1
+    while i >= 0:
+        a_i = A[i] if i < len(A) else 0
+        b_i = B[i] if i < len(B) else 0
+        if a_i > b_i:
+            return 1
+        elif a_i < b_i:
+            return -1
+        i -= 1
+    return 0
+
+def LongMulOneDigit(A, b):
+    n = len(A)
+    C = [0] * (n + 1)
+    carry = 0
+    for i in range(n):
+        temp = A[i] * b + carry
+        C[i] = temp & (2 ** 32 - 1)
+        carry = temp >> 32
+    C[n] = carry
+    while C and C[-1] == 0:
+        C.pop()
+    return C
+
+def LongShiftDigitsToHigh(A, shift):
+    n = len(A)
+    C = [0] * (n + shift)
+
+    for i in range(n):
+        C[i + shift] = A[i]
+    return C
+
+# Пороги (у 32-бітних цифрах) підібрані заміром на операндах 2048-16384 біт
+KARATSUBA_THRESHOLD = 48
+TOOM3_THRESHOLD = 128
+SQUARE_KARATSUBA_THRESHOLD = 96
+
+def _LongNormalize(A):
+    """Відкидає старші нульові цифри"""
+    n = len(A)
+    while n > 0 and A[n - 1] == 0:
+        n -= 1
+    return list(A[:n])
+
+def _LongAddFull(A, B):
+    """Додавання без втрати останнього переносу"""
+    if len(A) < len(B):
+        A, B = B, A
+    C = list(A) + [0]
+    carry = 0
+    for i in range(len(B)):
+        temp = C[i] + B[i] + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+    i = len(B)
+    while carry:
+        temp = C[i] + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+        i += 1
+    return C
+
+def _LongAddTo(C, X, offset=0):
+    """C += X * beta^offset на місці"""
+    carry = 0
+    i = offset
+    for x in X:
+        temp = C[i] + x + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+        i += 1
+    while carry:
+        temp = C[i] + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+        i += 1
+
+def _LongSubFrom(C, X, offset=0):
+    """C -= X * beta^offset на місці (результат невід'ємний)"""
+    borrow = 0
+    i = offset
+    for x in X:
+        temp = C[i] - x - borrow
+        C[i] = temp & 0xFFFFFFFF
+        borrow = 1 if temp < 0 else 0
+        i += 1
+    while borrow:
+        temp = C[i] - borrow
+        C[i] = temp & 0xFFFFFFFF
+        borrow = 1 if temp < 0 else 0
+        i += 1
+
+def _LongMulBasecase(A, B):
+    """Шкільне множення в одному масиві, перенос поширюється один раз в кінці"""
+    n = len(A) + len(B)
+    C = [0] * n
+    for j, b in enumerate(B):
+        if b:
+            for i, a in enumerate(A, j):
+                C[i] += a * b
+    carry = 0
+    for i in range(n):
+        temp = C[i] + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+    return C
+
+def _LongMulKaratsuba(A, B):
+    """Множення Карацуби, len(B) <= len(A) < 2 * len(B)"""
+    m = (len(A) + 1) // 2
+    a0, a1 = A[:m], A[m:]
+    b0, b1 = B[:m], B[m:]
+    z0 = _LongMulDispatch(a0, b0)
+    z2 = _LongMulDispatch(a1, b1)
+    z1 = _LongMulDispatch(_LongAddFull(a0, a1), _LongAddFull(b0, b1))
+    _LongSubFrom(z1, z0)
+    _LongSubFrom(z1, z2)
+    C = z0 + [0] * (len(A) + len(B) - len(z0))
+    _LongAddTo(C, _LongNormalize(z2), 2 * m)
+    _LongAddTo(C, _LongNormalize(z1), m)
+    return C
+
+def _SignedAdd(x, y):
+    """Додавання чисел зі знаком у вигляді (знак, цифри)"""
+    (sx, X), (sy, Y) = x, y
+    if not X:
+        return y
+    if not Y:
+        return x
+    if sx == sy:
+        return sx, _LongNormalize(_LongAddFull(X, Y))
+    cmp = LongCmp(X, Y)
+    if cmp == 0:
+        return 1, []
+    if cmp < 0:
+        sx, X, Y = sy, Y, X
+    return sx, _LongNormalize(LongSub(X, Y))
+
+def _SignedSub(x, y):
+    return _SignedAdd(x, (-y[0], y[1]))
+
+def _SignedMul(x, y):
+    return x[0] * y[0], _LongNormalize(_LongMulDispatch(x[1], y[1]))
+
+def _SignedDivExact(x, d):
+    """Точне ділення числа зі знаком на малу цифру d"""
+    X = x[1]
+    Q = [0] * len(X)
+    r = 0
+    for i in range(len(X) - 1, -1, -1):
+        cur = (r << 32) | X[i]
+        Q[i] = cur // d
+        r = cur - Q[i] * d
+    return x[0], _LongNormalize(Q)
+
+def _LongMulToom3(A, B):
+    """Множення Тоома-Кука (Toom-3) з інтерполяцією Бодрато, len(B) <= len(A) < 2 * len(B)"""
+    k = (len(A) + 2) // 3
+    a0, a1, a2 = [(1, _LongNormalize(A[i * k:(i + 1) * k])) for i in range(3)]
+    b0, b1, b2 = [(1, _LongNormalize(B[i * k:(i + 1) * k])) for i in range(3)]
+
+    p = _SignedAdd(a0, a2)
+    p1 = _SignedAdd(p, a1)
+    pm1 = _SignedSub(p, a1)
+    pm2 = _SignedAdd(pm1, a2)
+    pm2 = _SignedSub(_SignedAdd(pm2, pm2), a0)
+    q = _SignedAdd(b0, b2)
+    q1 = _SignedAdd(q, b1)
+    qm1 = _SignedSub(q, b1)
+    qm2 = _SignedAdd(qm1, b2)
+    qm2 = _SignedSub(_SignedAdd(qm2, qm2), b0)
+
+    r0 = _SignedMul(a0, b0)
+    r1 = _SignedMul(p1, q1)
+    rm1 = _SignedMul(pm1, qm1)
+    rm2 = _SignedMul(pm2, qm2)
+    r4 = _SignedMul(a2, b2)
+
+    r3 = _SignedDivExact(_SignedSub(rm2, r1), 3)
+    r1 = _SignedDivExact(_SignedSub(r1, rm1), 2)
+    r2 = _SignedSub(rm1, r0)
+    r3 = _SignedAdd(_SignedDivExact(_SignedSub(r2, r3), 2), _SignedAdd(r4, r4))
+    r2 = _SignedSub(_SignedAdd(r2, r1), r4)
+    r1 = _SignedSub(r1, r3)
+
+    C = [0] * (len(A) + len(B))
+    for i, (_, r) in enumerate((r0, r1, r2, r3, r4)):
+        _LongAddTo(C, r, i * k)
+    return C
+
+def _LongMulDispatch(A, B):
+    """Вибір алгоритму множення за розміром операндів, результат має len(A) + len(B) цифр"""
+    if len(A) < len(B):
+        A, B = B, A
+    la, lb = len(A), len(B)
+    if lb < KARATSUBA_THRESHOLD:
+        return _LongMulBasecase(A, B)
+    if la >= 2 * lb:
+        C = [0] * (la + lb)
+        for i in range(0, la, lb):
+            _LongAddTo(C, _LongNormalize(_LongMulDispatch(A[i:i + lb], B)), i)
+        return C
+    if lb < TOOM3_THRESHOLD:
+        return _LongMulKaratsuba(A, B)
+    return _LongMulToom3(A, B)
+
+def LongMul(A, B):
+    """Множення з вибором алгоритму: шкільне, Карацуба або Toom-3"""
+    if not B:
+        return []
+    C = _LongMulDispatch(_LongNormalize(A), _LongNormalize(B))
+    return C + [0] * (max(len(A) + len(B), 2 * len(B)) - len(C))
+
+def _LongSquareBasecase(A):
+    """Шкільне піднесення до квадрата: кожен перехресний добуток рахується один раз і подвоюється"""
+    n = len(A)
+    C = [0] * (2 * n)
+    for i in range(n - 1):
+        a = A[i]
+        if a:
+            for k, b in enumerate(A[i + 1:], 2 * i + 1):
+                C[k] += a * b
+    for i in range(n):
+        C[2 * i] = 2 * C[2 * i] + A[i] * A[i]
+        C[2 * i + 1] *= 2
+    carry = 0
+    for i in range(2 * n):
+        temp = C[i] + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+    return C
+
+def _LongSquareKaratsuba(A):
+    """Піднесення до квадрата за Карацубою: три квадрати половинної довжини"""
+    m = (len(A) + 1) // 2
+    a0, a1 = A[:m], A[m:]
+    z0 = _LongSquareDispatch(a0)
+    z2 = _LongSquareDispatch(a1)
+    z1 = _LongSquareDispatch(_LongAddFull(a0, a1))
+    _LongSubFrom(z1, z0)
+    _LongSubFrom(z1, z2)
+    C = z0 + [0] * (2 * len(A) - len(z0))
+    _LongAddTo(C, _LongNormalize(z2), 2 * m)
+    _LongAddTo(C, _LongNormalize(z1), m)
+    return C
+
+def _LongSquareDispatch(A):
+    if len(A) < SQUARE_KARATSUBA_THRESHOLD:
+        return _LongSquareBasecase(A)
+    return _LongSquareKaratsuba(A)
+
+def LongSquare(A):
+    """Піднесення до квадрата, результат збігається з LongMul(A, A)"""
+    C = _LongSquareDispatch(_LongNormalize(A))
+    return C + [0] * (2 * len(A) - len(C))
+
+def BitLength(n):
+    if n == 0:
+        return 0
+    return len(bin(n)) - 2
+
+def LongShiftBitsToHigh(num, shift):
+    return num << shift
+
+DIV_BURNIKEL_ZIEGLER_THRESHOLD = 48
+
+def _LongShiftBitsLeft(A, s):
+    """A * 2^s для 0 <= s < 32, результат на одну цифру довший"""
+    if s == 0:
+        return list(A) + [0]
+    C = [0] * (len(A) + 1)
+    carry = 0
+    for i, a in enumerate(A):
+        temp = (a << s) | carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+    C[len(A)] = carry
+    return C
+
+def _LongShiftBitsRight(A, s):
+    """A // 2^s для 0 <= s < 32"""
+    if s == 0:
+        return list(A)
+    n = len(A)
+    return [((A[i] >> s) | (A[i + 1] << (32 - s))) & 0xFFFFFFFF if i + 1 < n else A[i] >> s for i in range(n)]
+
+def _LongJoin(high, low, shift):
+    """high * beta^shift + low для low < beta^shift"""
+    if not high:
+        return _LongNormalize(low)
+    return list(low) + [0] * (shift - len(low)) + list(high)
+
+def _LongDivOneDigit(A, d):
+    Q = [0] * len(A)
+    r = 0
+    for i in range(len(A) - 1, -1, -1):
+        cur = (r << 32) | A[i]
+        Q[i], r = divmod(cur, d)
+    return _LongNormalize(Q), ([r] if r else [])
+
+def _LongDivKnuth(A, B):
+    """Алгоритм D Кнута для нормалізованих A і B, len(B) >= 2"""
+    n = len(B)
+    m = len(A) - n
+    if m < 0:
+        return [], list(A)
+    s = 32 - B[-1].bit_length()
+    V = _LongShiftBitsLeft(B, s)[:n]
+    U = _LongShiftBitsLeft(A, s)
+    Q = [0] * (m + 1)
+    v1, v2 = V[-1], V[-2]
+    for j in range(m, -1, -1):
+        qhat, rhat = divmod((U[j + n] << 32) | U[j + n - 1], v1)
+        while qhat > 0xFFFFFFFF or qhat * v2 > ((rhat << 32) | U[j + n - 2]):
+            qhat -= 1
+            rhat += v1
+            if rhat > 0xFFFFFFFF:
+                break
+        if qhat:
+            borrow = 0
+            carry = 0
+            for i in range(n):
+                p = qhat * V[i] + carry
+                carry = p >> 32
+                temp = U[i + j] - (p & 0xFFFFFFFF) - borrow
+                U[i + j] = temp & 0xFFFFFFFF
+                borrow = 1 if temp < 0 else 0
+            temp = U[j + n] - carry - borrow
+            U[j + n] = temp & 0xFFFFFFFF
+            if temp < 0:
+                qhat -= 1
+                carry = 0
+                for i in range(n):
+                    temp = U[i + j] + V[i] + carry
+                    U[i + j] = temp & 0xFFFFFFFF
+                    carry = temp >> 32
+                U[j + n] = (U[j + n] + carry) & 0xFFFFFFFF
+        Q[j] = qhat
+    return _LongNormalize(Q), _LongNormalize(_LongShiftBitsRight(U[:n], s))
+
+def _LongDiv2n1n(A, B, n):
+    """Бурнікель-Циглер: A < B * beta^n, B з n цифр і старшим бітом 1"""
+    if n % 2 or n < DIV_BURNIKEL_ZIEGLER_THRESHOLD:
+        return _LongDivKnuth(A, B)
+    half = n // 2
+    q1, r = _LongDiv3n2n(A[half:], B, half)
+    q2, r = _LongDiv3n2n(_LongJoin(r, A[:half], half), B, half)
+    return _LongJoin(q1, q2, half), r
+
+def _LongDiv3n2n(A, B, half):
+    """Ділення A з трьох половин на B з двох половин, A < B * beta^half"""
+    b1, b2 = B[half:], _LongNormalize(B[:half])
+    a12, a3 = A[half:], A[:half]
+    if LongCmp(a12[half:], b1) == 0:
+        q = [0xFFFFFFFF] * half
+        r = _LongNormalize(LongSub(_LongAddFull(a12, b1), [0] * half + b1))
+    else:
+        q, r = _LongDiv2n1n(_LongNormalize(a12), b1, half)
+    D = _LongNormalize(LongMul(q, b2))
+    r = _LongJoin(r, a3, half)
+    while LongCmp(r, D) < 0:
+        q = _LongNormalize(LongSub(q, [1]))
+        r = _LongNormalize(_LongAddFull(r, B))
+    return q, _LongNormalize(LongSub(r, D))
+
+def _LongDivModLimbs(A, B):
+    A, B = _LongNormalize(A), _LongNormalize(B)
+    if not B:
+        raise ValueError("Division by zero")
+    if LongCmp(A, B) < 0:
+        return [], A
+    if len(B) == 1:
+        return _LongDivOneDigit(A, B[0])
+    n = len(B)
+    if n < DIV_BURNIKEL_ZIEGLER_THRESHOLD:
+        return _LongDivKnuth(A, B)
+    # Дільник доповнюється до j * 2^t цифр (j < порогу) і нормалізується до старшого біта 1,
+    # щоб рекурсія Бурнікеля-Циглера ділила навпіл аж до алгоритму Кнута
+    t = 0
+    while -(-n // 2 ** t) >= DIV_BURNIKEL_ZIEGLER_THRESHOLD:
+        t += 1
+    nn = -(-n // 2 ** t) * 2 ** t
+    s = 32 - B[-1].bit_length()
+    pad = [0] * (nn - n)
+    B = pad + _LongShiftBitsLeft(B, s)[:n]
+    A = _LongNormalize(pad + _LongShiftBitsLeft(A, s))
+    chunks = -(-len(A) // nn)
+    if LongCmp(A[(chunks - 1) * nn:], B) >= 0:
+        chunks += 1
+    Q = []
+    r = []
+    for i in range(chunks - 1, -1, -1):
+        q, r = _LongDiv2n1n(_LongJoin(r, A[i * nn:(i + 1) * nn], nn), B, nn)
+        Q = _LongJoin(Q, q, nn)
+    R = _LongNormalize(_LongShiftBitsRight(r[nn - n:], s))
+    return _LongNormalize(Q), R
+
+def LongDivMod(A, B):
+    """Частка і остача A / B: алгоритм D Кнута, для довгих дільників - Бурнікель-Циглер
+
+    A і B - 32-бітні цифри (результат теж цифрами) або числа (результат числами).
+    """
+    if isinstance(A, int) and isinstance(B, int):
+        if B == 0:
+            raise ValueError("Division by zero")
+        Q, R = _LongDivModLimbs(to_base_2_32(A), to_base_2_32(B))
+        return _LimbsToInt(Q), _LimbsToInt(R)
+    return _LongDivModLimbs(A, B)
+
+def LongPowerWindow(A, B, w=None):
+    """Піднесення до степеня (без модуля) ковзним вікном, B - число або 32-бітні цифри"""
+    if w is None:
+        w = _WindowSize(_ExponentBits(B))
+    elif w < 1:
+        raise ValueError("Window size must be positive")
+    C = _SlidingWindowPower(_LongNormalize(A), B, w, LongMul, LongSquare, [1])
+    return _LongNormalize(C) or [0]
+
+def _BinaryGCD(a, b):
+    """Бінарний НСД для малих чисел: двійки відкидаються одразу за кількістю нульових молодших бітів"""
+    if a == 0 or b == 0:
+        return a | b
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+def _ExtEuclid(a, b):
+    """Розширений алгоритм Евкліда для малих чисел: u * a + v * b = НСД"""
+    u0, u1 = 1, 0
+    v0, v1 = 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        u0, u1 = u1, u0 - q * u1
+        v0, v1 = v1, v0 - q * v1
+    return a, u0, v0
+
+def _LongLinComb(A, a, B, b):
+    """a * A + b * B для цифр зі знаком |a|, |b| < beta, результат невід'ємний"""
+    n = max(len(A), len(B))
+    C = [0] * n
+    carry = 0
+    for i in range(n):
+        a_i = A[i] if i < len(A) else 0
+        b_i = B[i] if i < len(B) else 0
+        temp = a * a_i + b * b_i + carry
+        C[i] = temp & 0xFFFFFFFF
+        carry = temp >> 32
+    return _LongNormalize(C)
+
+def _SignedScale(x, c):
+    """Число зі знаком x, помножене на малий множник c зі знаком"""
+    sign = x[0] if c >= 0 else -x[0]
+    return sign, _LongNormalize(LongMul(x[1], to_base_2_32(abs(c))))
+
+def _LongTopWord(A, h):
+    """Біти A, починаючи з h-го (результат менший за 2^64)"""
+    i, s = h >> 5, h & 31
+    low = A[i] if i < len(A) else 0
+    high = A[i + 1] if i + 1 < len(A) else 0
+    top = A[i + 2] if i + 2 < len(A) else 0
+    return (((top << 64) | (high << 32) | low) >> s) & 0xFFFFFFFFFFFFFFFF
+
+LEHMER_THRESHOLD = 2
+
+def _LongGCDCore(A, B, track):
+    """НСД нормалізованих A >= B алгоритмом Лемера; з track повертає також x: x * A = НСД (mod B)"""
+    xa, xb = (1, [1]), (1, [])
+    while len(B) > LEHMER_THRESHOLD:
+        h = _ExponentBits(A) - 32
+        a_hat, b_hat = _LongTopWord(A, h), _LongTopWord(B, h)
+        a1, b1, c1, d1 = 1, 0, 0, 1
+        while b_hat + c1 != 0 and b_hat + d1 != 0:
+            q = (a_hat + a1) // (b_hat + c1)
+            if q != (a_hat + b1) // (b_hat + d1):
+                break
+            a1, c1 = c1, a1 - q * c1
+            b1, d1 = d1, b1 - q * d1
+            a_hat, b_hat = b_hat, a_hat - q * b_hat
+        if b1 == 0:
+            q, r = _LongDivModLimbs(A, B)
+            A, B = B, r
+            if track:
+                xa, xb = xb, _SignedSub(xa, _SignedMul(xb, (1, q)))
+        else:
+            A, B = _LongLinComb(A, a1, B, b1), _LongLinComb(A, c1, B, d1)
+            if track:
+                xa, xb = (_SignedAdd(_SignedScale(xa, a1), _SignedScale(xb, b1)),
+                          _SignedAdd(_SignedScale(xa, c1), _SignedScale(xb, d1)))
+    if B and len(A) > LEHMER_THRESHOLD:
+        q, r = _LongDivModLimbs(A, B)
+        A, B = B, r
+        if track:
+            xa, xb = xb, _SignedSub(xa, _SignedMul(xb, (1, q)))
+    a, b = _LimbsToInt(A), _LimbsToInt(B)
+    if not track:
+        return to_base_2_32(_BinaryGCD(a, b)), None
+    g, u, v = _ExtEuclid(a, b)
+    return to_base_2_32(g), _SignedAdd(_SignedScale(xa, u), _SignedScale(xb, v))
+
+def LongGCD(A, B):
+    """НСД 32-бітних цифр: Лемер для довгих чисел, бінарний алгоритм для малих"""
+    A, B = _LongNormalize(A), _LongNormalize(B)
+    if LongCmp(A, B) < 0:
+        A, B = B, A
+    return _LongGCDCore(A, B, False)[0]
+
+def LongExtGCD(A, B):
+    """Розширений НСД: (g, x, y), де A * x + B * y = g, а x і y - пари (знак, цифри)"""
+    A, B = _LongNormalize(A), _LongNormalize(B)
+    swap = LongCmp(A, B) < 0
+    if swap:
+        A, B = B, A
+    if not B:
+        g, x, y = A, (1, [1] if A else []), (1, [])
+    else:
+        g, x = _LongGCDCore(A, B, True)
+        rest = _SignedSub((1, g), _SignedMul(x, (1, A)))
+        Y, _ = _LongDivModLimbs(rest[1], B)
+        y = (rest[0], Y)
+    return (g, y, x) if swap else (g, x, y)
+
+def LongModInverse(A, N):
+    """A^(-1) mod N; ValueError, якщо НСД(A, N) != 1"""
+    N = _LongNormalize(N)
+    _, A = _LongDivModLimbs(A, N)
+    if not A:
+        raise ValueError("Element is not invertible")
+    g, x = _LongGCDCore(N, A, True)
+    if g != [1]:
+        raise ValueError("Element is not invertible")
+    # Коефіцієнт відстежувався для N, тож обернений до A виводиться з N * x + A * y = 1
+    rest = _SignedSub((1, [1]), _SignedMul(x, (1, N)))
+    y, _ = _LongDivModLimbs(rest[1], A)
+    if rest[0] < 0 and y:
+        _, y = _LongDivModLimbs(y, N)
+        return _LongNormalize(LongSub(N, y)) if y else []
+    return _LongDivModLimbs(y, N)[1]
+
+def gcd_and_lcm(A, B):
+    # для Python int бінарний НСД без переведення в цифри швидший за Лемера на цифрах
+    gcd = _BinaryGCD(A, B)
+    lcm = (A // gcd) * B if gcd else 0
+    return gcd, lcm
+
+def KillLastDigits(x, counter):
+    k = len(x)
+    if k < counter:
+        return [0]
+    return x[counter:]
+
+def ComputeMU(n):
+    """Обчислює μ для алгоритму Барретта"""
+    k = len(n)
+    beta_2k = [0] * (2 * k) + [1]
+    mu, _ = LongDivMod(beta_2k, n)
+    return mu
+
+def BarrettReduction(x, n, mu):
+    k = len(n)
+    #print(f'k = {k}')
+    q = KillLastDigits(x, k - 1)
+    #print(f'q1 = {q}')
+    q = LongMul(q, mu)
+    #print(f'q2 = {q}')
+    q = KillLastDigits(q, k + 1)
+    #print(f'q3 = {q}')
+    qn = LongMul(q, n)
+    #print(f'qn = {qn}')
+    if len(qn) > len(x):
+        qn = qn[:len(x)]
+    r = LongSub(x, qn)
+    #print(f'r1 = {r}')
+    while LongCmp(r, n) >= 0:
+        r = LongSub(r, n)
+    return r[:k]
+
+def _BarrettReduceAny(A, n, mu):
+    """Редукція Барретта для A довільної довжини: старші 2k цифри зводяться по черзі"""
+    k = len(n)
+    A = _LongNormalize(A)
+    while len(A) > 2 * k:
+        split = len(A) - 2 * k
+        A = _LongNormalize(A[:split] + BarrettReduction(A[split:], n, mu))
+    return BarrettReduction(A, n, mu)
+
+def _ModulusParams(n, mu):
+    """Повертає (n, mu) з контексту модуля або з кешу контекстів, якщо mu не задано"""
+    if isinstance(n, (BarrettContext, MontgomeryContext)):
+        return n.n, n.mu
+    if mu is None:
+        ctx = GetModContext(n)
+        return ctx.n, ctx.mu
+    return n, mu
+
+def LongAddMod(A, B, n, mu=None):
+    n, mu = _ModulusParams(n, mu)
+    C = _LongAddFull(A, B)
+    C_mod_n = BarrettReduction(C, n, mu)
+    return C_mod_n
+
+def LongSubMod(A, B, n, mu=None):
+    n, mu = _ModulusParams(n, mu)
+    if LongCmp(B, n) >= 0:
+        B = _BarrettReduceAny(B, n, mu)
+    if LongCmp(A, B) < 0:
+        C = LongSub(_LongAddFull(A, n), B)
+    else:
+        C = LongSub(A, B)
+    C_mod_n = BarrettReduction(C, n, mu)
+    return C_mod_n
+
+def LongMulMod(A, B, n, mu=None):
+    n, mu = _ModulusParams(n, mu)
+    C = LongMul(A, B)
+    C_mod_n = BarrettReduction(C, n, mu)
+    return C_mod_n
+
+def LongMulSquareMod(A, n, mu=None):
+    n, mu = _ModulusParams(n, mu)
+    C = LongSquare(A)
+    C_mod_n = BarrettReduction(C, n, mu)
+    return C_mod_n
+
+
+def LongModPowerBarrett(A, B, N):
+    """Піднесення до степеня за модулем Барреттом, B - число або список бітів (старший перший)"""
+    if not isinstance(B, int):
+        B = int(''.join(str(bit) for bit in B) or '0', 2)
+    return LongModPower(A, B, N, method="barrett")
+
+
+def _ExponentBits(B):
+    """Розрядність показника, заданого числом або 32-бітними цифрами"""
+    if isinstance(B, int):
+        if B < 0:
+            raise ValueError("Exponent must be non-negative")
+        return B.bit_length()
+    B = _LongNormalize(B)
+    if not B:
+        return 0
+    return 32 * (len(B) - 1) + B[-1].bit_length()
+
+def _ExponentBit(B, i):
+    if isinstance(B, int):
+        return (B >> i) & 1
+    if i >> 5 >= len(B):
+        return 0
+    return (B[i >> 5] >> (i & 31)) & 1
+
+
+class BarrettContext:
+    """Контекст модуля для редукції Барретта (mu обчислюється один раз)"""
+
+    def __init__(self, n):
+        if isinstance(n, int):
+            n = to_base_2_32(n)
+        self.n = _LongNormalize(n)
+        if not self.n:
+            raise ValueError("Modulus must be positive")
+        self.k = len(self.n)
+        self.mu = ComputeMU(self.n)
+        self.one = self.to_form([1])
+
+    def to_form(self, A):
+        if LongCmp(A, self.n) >= 0:
+            return _BarrettReduceAny(A, self.n, self.mu)
+        return list(A)
+
+    def from_form(self, A):
+        return list(A)
+
+    def mul(self, A, B):
+        return LongMulMod(A, B, self.n, self.mu)
+
+    def sqr(self, A):
+        return LongMulSquareMod(A, self.n, self.mu)
+
+
+class MontgomeryContext:
+    """Контекст модуля для множення Монтгомері, R = beta^k, n має бути непарним"""
+
+    def __init__(self, n, mu=None):
+        if isinstance(n, int):
+            n = to_base_2_32(n)
+        self.n = _LongNormalize(n)
+        if not self.n or self.n[0] % 2 == 0:
+            raise ValueError("Montgomery modulus must be odd")
+        self.k = len(self.n)
+        inv = self.n[0]
+        for _ in range(4):
+            inv = (inv * (2 - self.n[0] * inv)) & 0xFFFFFFFF
+        self.n_prime = (-inv) & 0xFFFFFFFF
+        self.mu = ComputeMU(self.n) if mu is None else mu
+        r = BarrettReduction([0] * self.k + [1], self.n, self.mu)
+        self.r2 = LongMulMod(r, r, self.n, self.mu)
+        self.one = r + [0] * (self.k - len(r))
+
+    def _finish(self, T):
+        """Нормалізує цифри T[k:] після редукції та віднімає n, якщо потрібно"""
+        k = self.k
+        C = [0] * (k + 1)
+        carry = 0
+        for i in range(k + 1):
+            temp = T[k + i] + carry
+            C[i] = temp & 0xFFFFFFFF
+            carry = temp >> 32
+        if LongCmp(C, self.n) >= 0:
+            C = LongSub(C, self.n)
+        return C[:k]
+
+    def reduce(self, T):
+        """SOS-редукція: T * R^(-1) mod n для T < n * R"""
+        n, k, n_prime = self.n, self.k, self.n_prime
+        T = list(T) + [0] * (2 * k + 1 - len(T))
+        for i in range(k):
+            m = (T[i] * n_prime) & 0xFFFFFFFF
+            for j, x in enumerate(n, i):
+                T[j] += m * x
+            T[i + 1] += T[i] >> 32
+        return self._finish(T)
+
+    def mul(self, A, B):
+        """CIOS-множення: A * B * R^(-1) mod n, множення і редукція чергуються по цифрах A"""
+        n, k, n_prime = self.n, self.k, self.n_prime
+        T = [0] * (2 * k + 1)
+        for i in range(k):
+            a = A[i] if i < len(A) else 0
+            if a:
+                for j, b in enumerate(B, i):
+                    T[j] += a * b
+            m = (T[i] * n_prime) & 0xFFFFFFFF
+            for j, x in enumerate(n, i):
+                T[j] += m * x
+            T[i + 1] += T[i] >> 32
+        return self._finish(T)
+
+    def sqr(self, A):
+        return self.reduce(LongSquare(A))
+
+    def to_form(self, A):
+        """Переведення у форму Монтгомері: A * R mod n"""
+        if LongCmp(A, self.n) >= 0:
+            A = _BarrettReduceAny(A, self.n, self.mu)
+        return self.mul(A, self.r2)
+
+    def from_form(self, A):
+        """Переведення з форми Монтгомері: A * R^(-1) mod n"""
+        return self.reduce(A)
+
+
+def _ExponentWindow(B, lo, hi):
+    """Біти показника з lo по hi включно як число"""
+    if isinstance(B, int):
+        return (B >> lo) & ((1 << (hi - lo + 1)) - 1)
+    value = 0
+    for i in range(hi, lo - 1, -1):
+        value = (value << 1) | _ExponentBit(B, i)
+    return value
+
+def _WindowSize(bits):
+    """Ширина вікна за розрядністю показника (мінімум множень для ковзного вікна)"""
+    for w, limit in ((1, 24), (3, 80), (4, 240), (5, 672)):
+        if bits <= limit:
+            return w
+    return 6
+
+def _OddPowersTable(base, w, mul, sqr):
+    """Таблиця непарних степенів base^1, base^3, ..., base^(2^w - 1)"""
+    table = [base]
+    if w > 1:
+        base2 = sqr(base)
+        for _ in range(2 ** (w - 1) - 1):
+            table.append(mul(table[-1], base2))
+    return table
+
+def _SlidingWindowPower(base, B, w, mul, sqr, one, table=None):
+    """Ковзне вікно зліва направо: показник читається вікнами до w бітів без розкладу в список"""
+    if table is None:
+        table = _OddPowersTable(base, w, mul, sqr)
+    c = None
+    i = _ExponentBits(B) - 1
+    while i >= 0:
+        if not _ExponentBit(B, i):
+            if c is not None:
+                c = sqr(c)
+            i -= 1
+            continue
+        j = max(i - w + 1, 0)
+        while not _ExponentBit(B, j):
+            j += 1
+        value = _ExponentWindow(B, j, i)
+        if c is None:
+            c = table[value >> 1]
+        else:
+            for _ in range(i - j + 1):
+                c = sqr(c)
+            c = mul(c, table[value >> 1])
+        i = j - 1
+    return one if c is None else c
+
+class ModContext(BarrettContext):
+    """Контекст модуля для повторного використання: mu, k, контекст Монтгомері та таблиці вікон
+
+    Створюється через GetModContext, щоб підготовка виконувалась один раз на модуль.
+    """
+
+    def __init__(self, n, table_cache_size=16):
+        super().__init__(n)
+        self._montgomery = None
+        self.tables = OrderedDict()
+        self.table_cache_size = table_cache_size
+
+    @property
+    def montgomery(self):
+        """Контекст Монтгомері для того ж модуля (лише для непарного n), створюється ліниво"""
+        if self._montgomery is None:
+            self._montgomery = MontgomeryContext(self.n, self.mu)
+        return self._montgomery
+
+    def window_table(self, ctx, base, w):
+        """Таблиця непарних степенів base у формі ctx, кешована за (метод, base, w)"""
+        key = (isinstance(ctx, MontgomeryContext), tuple(base), w)
+        table = self.tables.get(key)
+        if table is None:
+            table = _OddPowersTable(base, w, ctx.mul, ctx.sqr)
+            self.tables[key] = table
+            if len(self.tables) > self.table_cache_size:
+                self.tables.popitem(last=False)
+        else:
+            self.tables.move_to_end(key)
+        return table
+
+
+MOD_CONTEXT_CACHE_SIZE = 64
+_mod_context_cache = OrderedDict()
+
+def GetModContext(n):
+    """Контекст модуля з LRU-кешу (не більше MOD_CONTEXT_CACHE_SIZE модулів)"""
+    if isinstance(n, ModContext):
+        return n
+    if isinstance(n, int):
+        n = to_base_2_32(n)
+    key = tuple(_LongNormalize(n))
+    ctx = _mod_context_cache.get(key)
+    if ctx is None:
+        ctx = ModContext(list(key))
+        _mod_context_cache[key] = ctx
+        while len(_mod_context_cache) > MOD_CONTEXT_CACHE_SIZE:
+            _mod_context_cache.popitem(last=False)
+    else:
+        _mod_context_cache.move_to_end(key)
+    return ctx
+
+def _ReductionContext(N, method):
+    if isinstance(N, MontgomeryContext):
+        return N
+    if isinstance(N, BarrettContext) and not isinstance(N, ModContext):
+        return N
+    N = GetModContext(N)
+    if method == "barrett":
+        return N
+    if method == "montgomery":
+        return N.montgomery
+    raise ValueError(f"Unknown reduction method: {method}")
+
+def LongModPower(A, B, N, method="barrett", w=None, reuse_table=False):
+    """Піднесення до степеня за модулем ковзним вікном з вибором редукції: "barrett" або "montgomery"
+
+    B - число або 32-бітні цифри, N - число, 32-бітні цифри або контекст модуля.
+    Ширина вікна w за замовчуванням обирається за розрядністю показника.
+    З reuse_table=True таблиця степеня основи зберігається в ModContext для наступних викликів.
+    """
+    ctx = _ReductionContext(N, method)
+    if w is None:
+        w = _WindowSize(_ExponentBits(B))
+    elif w < 1:
+        raise ValueError("Window size must be positive")
+    base = ctx.to_form(A)
+    table = None
+    if reuse_table:
+        table = GetModContext(ctx.n).window_table(ctx, base, w)
+    c = _SlidingWindowPower(base, B, w, ctx.mul, ctx.sqr, ctx.one, table)
+    return _LongNormalize(ctx.from_form(c))
+
+
+
+FIXED_BASE_TABLE_LIMIT = 4 * 1024 * 1024
+
+class FixedBaseComb:
+    """Гребінь Ліма-Лі для фіксованої основи g за модулем n
+
+    Таблиця містить добутки g^(2^(a*j)) для всіх підмножин j < h, де h зубців гребеня
+    і a = ceil(max_bits / h). Піднесення до степеня потребує a - 1 квадратів і до a множень.
+    Кількість зубців обирається так, щоб таблиця не перевищувала max_bytes.
+    """
+
+    def __init__(self, g, n, max_bits=None, method="barrett", h=None, max_bytes=FIXED_BASE_TABLE_LIMIT):
+        self.ctx = _ReductionContext(n, method)
+        self.g = _LongNormalize(g)
+        self.max_bits = max_bits or 32 * self.ctx.k
+        base = self.ctx.to_form(self.g)
+        if h is None:
+            # кожен елемент таблиці має k цифр, незалежно від розміру g
+            entry = [0xFFFFFFFF] * self.ctx.k
+            entry_bytes = sys.getsizeof(entry) + sum(sys.getsizeof(x) for x in entry)
+            h = 1
+            while h < 16 and (2 ** (h + 1)) * entry_bytes <= max_bytes:
+                h += 1
+        elif h < 1:
+            raise ValueError("Number of comb teeth must be positive")
+        self.h = h
+        self.a = -(-self.max_bits // h)
+        teeth = [base]
+        for _ in range(h - 1):
+            tooth = teeth[-1]
+            for _ in range(self.a):
+                tooth = self.ctx.sqr(tooth)
+            teeth.append(tooth)
+        self.table = [self.ctx.one]
+        for u in range(1, 2 ** h):
+            top = u.bit_length() - 1
+            rest = u ^ (1 << top)
+            self.table.append(teeth[top] if rest == 0 else self.ctx.mul(self.table[rest], teeth[top]))
+
+    def power(self, B):
+        """g^B mod n, B - число або 32-бітні цифри"""
+        if _ExponentBits(B) > self.max_bits:
+            return LongModPower(self.g, B, self.ctx)
+        ctx, a, h = self.ctx, self.a, self.h
+        c = None
+        for i in range(a - 1, -1, -1):
+            if c is not None:
+                c = ctx.sqr(c)
+            u = 0
+            for j in range(h - 1, -1, -1):
+                u = (u << 1) | _ExponentBit(B, i + a * j)
+            if u:
+                c = self.table[u] if c is None else ctx.mul(c, self.table[u])
+        return _LongNormalize(ctx.from_form(ctx.one if c is None else c))
+
+def LongModPowerFixedBase(g, B, N, method="barrett", max_bytes=FIXED_BASE_TABLE_LIMIT):
+    """g^B mod N з гребенем, що будується один раз на пару (g, N) і зберігається в ModContext"""
+    mod_ctx = GetModContext(N.n if isinstance(N, (BarrettContext, MontgomeryContext)) else N)
+    key = ("comb", method, tuple(_LongNormalize(g)), max_bytes)
+    comb = mod_ctx.tables.get(key)
+    if comb is None:
+        comb = FixedBaseComb(g, mod_ctx, method=method, max_bytes=max_bytes)
+        mod_ctx.tables[key] = comb
+        if len(mod_ctx.tables) > mod_ctx.table_cache_size:
+            mod_ctx.tables.popitem(last=False)
+    else:
+        mod_ctx.tables.move_to_end(key)
+    return comb.power(B)
+
+
+def BatchFromLimbs(rows, k=None):
+    """Пакет чисел як двовимірний масив uint64: рядок - число, стовпець - 32-бітна цифра"""
+    rows = [_LongNormalize(row) for row in rows]
+    if k is None:
+        k = max((len(row) for row in rows), default=0) or 1
+    batch = np.zeros((len(rows), k), dtype=np.uint64)
+    for i, row in enumerate(rows):
+        if len(row) > k:
+            raise ValueError("Number does not fit into the batch width")
+        batch[i, :len(row)] = row
+    return batch
+
+def BatchToLimbs(batch):
+    return [[int(x) for x in row] for row in batch]
+
+def _BatchPad(A, k):
+    if A.shape[1] >= k:
+        return A
+    return np.concatenate([A, np.zeros((A.shape[0], k - A.shape[1]), dtype=np.uint64)], axis=1)
+
+def _BatchCarry(C):
+    """Векторне поширення переносу: прохід по стовпцях для всіх рядків одночасно"""
+    carry = np.zeros(C.shape[0], dtype=np.uint64)
+    for i in range(C.shape[1]):
+        temp = C[:, i] + carry
+        C[:, i] = temp & np.uint64(0xFFFFFFFF)
+        carry = temp >> np.uint64(32)
+    return C
+
+def BatchAdd(A, B, keep_carry=False):
+    """Порядкове додавання; як LongAdd, старший перенос відкидається, якщо не keep_carry"""
+    k = max(A.shape[1], B.shape[1])
+    C = _BatchPad(A, k + 1) + _BatchPad(B, k + 1)
+    C = _BatchCarry(C)
+    return C if keep_carry else C[:, :k]
+
+def BatchSub(A, B):
+    """Порядкове віднімання за модулем beta^k, як LongSub"""
+    k = max(A.shape[1], B.shape[1])
+    A, B = _BatchPad(A, k), _BatchPad(B, k)
+    C = np.empty(np.broadcast_shapes(A.shape, B.shape), dtype=np.uint64)
+    borrow = np.zeros(C.shape[0], dtype=np.uint64)
+    for i in range(k):
+        temp = (A[:, i] | np.uint64(1 << 32)) - B[:, i] - borrow
+        C[:, i] = temp & np.uint64(0xFFFFFFFF)
+        borrow = np.uint64(1) - (temp >> np.uint64(32))
+    return C
+
+def BatchCmp(A, B):
+    """Порядкове порівняння, як LongCmp: масив з -1, 0, 1"""
+    k = max(A.shape[1], B.shape[1])
+    A, B = _BatchPad(A, k), _BatchPad(B, k)
+    result = np.zeros(np.broadcast_shapes(A.shape, B.shape)[0], dtype=np.int8)
+    for i in range(k - 1, -1, -1):
+        undecided = result == 0
+        result[undecided & (A[:, i] > B[:, i])] = 1
+        result[undecided & (A[:, i] < B[:, i])] = -1
+    return result
+
+def BatchMulOneDigit(A, b):
+    """Множення кожного рядка на цифру b (число або вектор по рядках), k + 1 стовпців"""
+    b = np.asarray(b, dtype=np.uint64).reshape(-1, 1)
+    P = A * b
+    C = np.zeros((P.shape[0], A.shape[1] + 1), dtype=np.uint64)
+    C[:, :-1] += P & np.uint64(0xFFFFFFFF)
+    C[:, 1:] += P >> np.uint64(32)
+    return _BatchCarry(C)
+
+def BatchMul(A, B):
+    """Порядкове шкільне множення, результат має kA + kB стовпців
+
+    Добутки цифр розкладаються на молодшу і старшу половини, які накопичуються
+    окремо, тому суми в стовпцях не переповнюють uint64.
+    """
+    ka, kb = A.shape[1], B.shape[1]
+    rows = np.broadcast_shapes(A.shape[:1], B.shape[:1])[0]
+    C = np.zeros((rows, ka + kb), dtype=np.uint64)
+    for j in range(kb):
+        P = A * B[:, j:j + 1]
+        C[:, j:j + ka] += P & np.uint64(0xFFFFFFFF)
+        C[:, j + 1:j + ka + 1] += P >> np.uint64(32)
+    return _BatchCarry(C)
+
+def BatchBarrettReduction(X, n, mu):
+    """Редукція Барретта для всіх рядків X < beta^2k, результат має k стовпців"""
+    n, mu = _ModulusParams(n, mu)
+    k = len(n)
+    if X.shape[1] > 2 * k:
+        raise ValueError("Batch rows must be shorter than 2k limbs")
+    X = _BatchPad(X, 2 * k)
+    N = np.array([n], dtype=np.uint64)
+    q = BatchMul(X[:, k - 1:], np.array([mu], dtype=np.uint64))[:, k + 1:]
+    qn = BatchMul(q, N)[:, :k + 1]
+    r = BatchSub(X[:, :k + 1], qn)
+    N = _BatchPad(N, k + 1)
+    for _ in range(2):
+        over = BatchCmp(r, N) >= 0
+        if not over.any():
+            break
+        r[over] = BatchSub(r[over], N)
+    return r[:, :k]
+
+def BatchAddMod(A, B, n, mu=None):
+    n, mu = _ModulusParams(n, mu)
+    return BatchBarrettReduction(BatchAdd(A, B, keep_carry=True), n, mu)
+
+def BatchMulMod(A, B, n, mu=None):
+    n, mu = _ModulusParams(n, mu)
+    return BatchBarrettReduction(BatchMul(A, B), n, mu)
+
+
+_modpow_pools = {}
+
+def _ModPowPool(workers):
+    """Пул процесів, спільний для всіх викликів з однаковою кількістю процесів"""
+    pool = _modpow_pools.get(workers)
+    if pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+        _modpow_pools[workers] = pool
+    return pool
+
+def shutdown_modpow_pools():
+    for pool in _modpow_pools.values():
+        pool.shutdown()
+    _modpow_pools.clear()
+
+def _ModPowChunk(n, method, bases, exps):
+    # Контекст береться з LRU-кешу процесу, тож готується один раз на процес і модуль
+    ctx = _ReductionContext(n, method)
+    return [LongModPower(a, e, ctx) for a, e in zip(bases, exps)]
+
+def modpow_many(bases, exps, N, workers=None, method=None, chunksize=None):
+    """Пакетне піднесення до степеня за модулем у пулі процесів, результати в порядку входу
+
+    Вхід ділиться на частини (за замовчуванням по 4 на процес), щоб зменшити накладні
+    витрати на передачу даних. Пул процесів зберігається між викликами.
+    Без method редукція береться з типу контексту N, інакше "barrett".
+    """
+    bases, exps = list(bases), list(exps)
+    if len(bases) != len(exps):
+        raise ValueError("bases and exps must have the same length")
+    if isinstance(N, MontgomeryContext):
+        if method not in (None, "montgomery"):
+            raise ValueError(f"Method {method!r} conflicts with a MontgomeryContext modulus")
+        method = "montgomery"
+    elif method is None:
+        method = "barrett"
+    if isinstance(N, (BarrettContext, MontgomeryContext)):
+        n = N.n
+    else:
+        n = GetModContext(N).n
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(bases) <= 1:
+        return _ModPowChunk(n, method, bases, exps)
+    if chunksize is None:
+        chunksize = max(1, -(-len(bases) // (4 * workers)))
+    pool = _ModPowPool(workers)
+    futures = [
+        pool.submit(_ModPowChunk, n, method, bases[i:i + chunksize], exps[i:i + chunksize])
+        for i in range(0, len(bases), chunksize)
+    ]
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
@@ -0,0 +1,250 @@
+from ._lazy import LazyModule
+
+np = LazyModule("numpy")
+
+
+class GaloisFieldONB:
+    def __init__(self, m, lambda_rows=None):
+        if m <= 0:
+            raise ValueError("Степінь розширення має бути додатнім")
+        self.m = m
+        self.p = 2 * m + 1
+        self.powers_of_2 = [pow(2, i, self.p) for i in range(self.m)]
+        self.mask = (1 << m) - 1
+        self.words = (m + 63) // 64
+        self.zero = 0
+        self.one = self.mask  # одиниця нормального базису — сума всіх beta^(2^i)
+        self._matrix = None
+        # lambda_rows може прийти з кешу (srom.fields), інакше будується тут
+        self.lambda_rows = self._compute_lambda() if lambda_rows is None else lambda_rows
+
+
+    def is_prime(self, n):
+        '''Перевірка числа на простоту'''
+        if n <= 1:
+            return False
+        if n == 2 or n == 3:
+            return True
+        if n % 2 == 0 or n % 3 == 0:
+            return False
+        d = 5
+        while d * d <= n:
+            if n % d == 0 or n % (d + 2) == 0:
+                return False
+            d += 6
+        return True
+
+    def find_k(self, p):
+        """Знайдемо найменше k, таке що 2^k ≡ 1 (mod p)"""
+        value = 2
+        k = 1
+        while value != 1:
+            value = (value * 2) % p
+            k += 1
+        return k
+
+    def check_ONB(self):
+        """Перевірка існування оптимального нормального базису"""
+        p = self.p
+        if not self.is_prime(p):
+            return False, None
+        k = self.find_k(p)
+        if k == 2 * self.m:
+            return True, k
+        elif p % 4 == 3 and k == self.m:
+            return True, k
+        else:
+            return False, k
+
+    def _compute_matrix(self):
+        """Обчислення мультиплікативної матриці"""
+        matrix = [[0] * self.m for _ in range(self.m)]
+        for i in range(self.m):
+            for j in range(self.m):
+                if (self.powers_of_2[i] + self.powers_of_2[j]) % self.p == 1:
+                    matrix[i][j] = 1
+                elif (self.powers_of_2[i] - self.powers_of_2[j]) % self.p == 1:
+                    matrix[i][j] = 1
+                elif (-self.powers_of_2[i] + self.powers_of_2[j]) % self.p == 1:
+                    matrix[i][j] = 1
+                elif (-self.powers_of_2[i] - self.powers_of_2[j]) % self.p == 1:
+                    matrix[i][j] = 1
+        return matrix
+
+    @property
+    def matrix(self):
+        """Щільна λ-матриця m×m (будується лише на вимогу)"""
+        if self._matrix is None:
+            self._matrix = self._compute_matrix()
+        return self._matrix
+
+    def _compute_lambda(self):
+        """λ-матриця як списки індексів одиниць у кожному рядку (2m-1 одиниць для типу II)"""
+        if not self.check_ONB()[0]:
+            return [[j for j in range(self.m) if self.matrix[i][j]] for i in range(self.m)]
+        # 2^j ≡ ±1 ± 2^i (mod p): за O(m) через дискретний логарифм за основою 2
+        p = self.p
+        log2 = {v: j for j, v in enumerate(self.powers_of_2)}
+        rows = []
+        for t in self.powers_of_2:
+            candidates = ((1 - t) % p, (t - 1) % p, (1 + t) % p, (-1 - t) % p)
+            rows.append(sorted({log2[v] for v in candidates if v in log2}))
+        return rows
+
+    def add(self, a, b):
+        return a ^ b
+
+    def _rotate_left(self, val, positions):
+        """Циклічний зсув вліво"""
+        positions = positions % self.m
+        return ((val << positions) | (val >> (self.m - positions))) & ((1 << self.m) - 1)
+
+    def _rotate_right(self, val, positions):
+        """Циклічний зсув вправо"""
+        positions = positions % self.m
+        return ((val >> positions) | (val << (self.m - positions))) & ((1 << self.m) - 1)
+
+    def square(self, a):
+        '''Піднесення до квадрата через циклічний зсув вправо'''
+        return self._rotate_right(a, 1)
+
+    def sum(self, value):
+        """Обчислення суми коефіцієнтів елемента"""
+        return (value & self.mask).bit_count()
+
+    def trace(self, value):
+        """Обчислення сліду елемента (суму коефіцієнтів за модулем 2)."""
+        return self.sum(value) % 2
+
+    def mul(self, a, b):
+        """Множення Мессі–Омури: c = XOR по i (rotl(a, i) & XOR по j з λ_i rotl(b, j))"""
+        m, mask = self.m, self.mask
+        # rotl(x, i) = (x * (2^m + 1) >> (m - i)) & mask
+        a2 = (a << m) | a
+        b2 = (b << m) | b
+        result = 0
+        for i, row in enumerate(self.lambda_rows):
+            t = 0
+            for j in row:
+                t ^= b2 >> (m - j)
+            result ^= (a2 >> (m - i)) & t
+        return result & mask
+
+    def square_k(self, a, k):
+        """a^(2^k): циклічний зсув вправо на k"""
+        return self._rotate_right(a, k)
+
+    def _window_size(self, bits):
+        """Ширина вікна з мінімумом множень: таблиця 2^w - 2 плюс по одному на вікно"""
+        return min(range(1, 9), key=lambda w: (1 << w) - 2 + -(-bits // w))
+
+    def power_n(self, num, n, w=None):
+        """Піднесення до степеня n вікнами по w біт: a^n = добуток (a^d_i)^(2^(w*i)), квадрати — зсуви"""
+        if n < 0:
+            raise ValueError("Exponent must be non-negative")
+        num &= self.mask
+        if num == 0:
+            return self.one if n == 0 else self.zero
+        n %= self.mask  # a^(2^m - 1) = 1 для a != 0
+        if n == 0:
+            return self.one
+        if w is None:
+            w = self._window_size(n.bit_length())
+        elif w < 1:
+            raise ValueError("Window size must be positive")
+        table = [self.one, num]
+        for _ in range(2, 1 << w):
+            table.append(self.mul(table[-1], num))
+        digit_mask = (1 << w) - 1
+        result = None
+        shift = 0
+        while n:
+            digit = n & digit_mask
+            if digit:
+                term = self._rotate_right(table[digit], shift)
+                result = term if result is None else self.mul(result, term)
+            n >>= w
+            shift += w
+        return result
+
+    def inverse(self, a):
+        """Обернений за Ітох–Цудзії: a^(-1) = (a^(2^(m-1) - 1))^2, ~log2(m) множень"""
+        a &= self.mask
+        if a == 0:
+            raise ValueError("Element 0 is not invertible")
+        n = self.m - 1
+        beta, k = a, 1  # beta = a^(2^k - 1)
+        for i in range(n.bit_length() - 2, -1, -1):
+            beta = self.mul(self.square_k(beta, k), beta)
+            k <<= 1
+            if (n >> i) & 1:
+                beta = self.mul(self.square(beta), a)
+                k += 1
+        return self.square(beta)
+
+    def batch_from_ints(self, elements):
+        """Пакет елементів як масив uint64 (N, ceil(m/64)): слово 0 — молодші 64 біти"""
+        nbytes = 8 * self.words
+        data = b''.join((a & self.mask).to_bytes(nbytes, 'little') for a in elements)
+        return np.frombuffer(data, dtype='<u8').reshape(-1, self.words).astype(np.uint64)
+
+    def batch_to_ints(self, batch):
+        return [int.from_bytes(row.astype('<u8').tobytes(), 'little') for row in batch]
+
+    def _batch_top_mask(self):
+        bits = self.m - 64 * (self.words - 1)
+        return np.uint64((1 << bits) - 1)
+
+    def _batch_shift(self, A, s):
+        """Зсув усіх рядків на s біт (s > 0 — вліво, s < 0 — вправо) у межах words слів"""
+        words = self.words
+        q, r = divmod(abs(s), 64)
+        C = np.zeros_like(A)
+        if q >= words:
+            return C
+        if s >= 0:
+            C[:, q:] = A[:, :words - q] << np.uint64(r)
+            if r and q + 1 < words:
+                C[:, q + 1:] |= A[:, :words - q - 1] >> np.uint64(64 - r)
+        else:
+            C[:, :words - q] = A[:, q:] >> np.uint64(r)
+            if r and q + 1 < words:
+                C[:, :words - q - 1] |= A[:, q + 1:] << np.uint64(64 - r)
+        return C
+
+    def batch_rotate_left(self, A, positions):
+        """Циклічний зсув вліво всіх рядків пакета"""
+        positions %= self.m
+        if positions == 0:
+            return A.copy()
+        C = self._batch_shift(A, positions)
+        C[:, -1] &= self._batch_top_mask()
+        C |= self._batch_shift(A, positions - self.m)
+        return C
+
+    def batch_add(self, A, B):
+        return A ^ B
+
+    def batch_square(self, A):
+        """Піднесення до квадрата всіх рядків: циклічний зсув вправо на 1"""
+        return self.batch_rotate_left(A, self.m - 1)
+
+    def batch_trace(self, A):
+        """Слід кожного рядка: парність кількості одиниць (згортка слів XOR)"""
+        x = np.bitwise_xor.reduce(A, axis=1)
+        for shift in (32, 16, 8, 4, 2, 1):
+            x ^= x >> np.uint64(shift)
+        return (x & np.uint64(1)).astype(np.uint8)
+
+    def batch_mul(self, A, B):
+        """Множення Мессі–Омури для всіх рядків одночасно, як mul"""
+        A, B = np.broadcast_arrays(A, B)
+        C = np.zeros_like(A)
+        for i, row in enumerate(self.lambda_rows):
+            if not row:
+                continue
+            T = self.batch_rotate_left(B, row[0])
+            for j in row[1:]:
+                T ^= self.batch_rotate_left(B, j)
+            C ^= self.batch_rotate_left(A, i) & T
+        return C